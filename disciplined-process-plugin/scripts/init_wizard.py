@@ -11,6 +11,7 @@ import json
 import shutil
 import subprocess
 import sys
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -72,10 +73,8 @@ def detect_project_name(project_dir: Path) -> str:
     return project_dir.name
 
 
-def detect_languages(project_dir: Path) -> list[str]:
-    """Detect programming languages used in the project."""
-    languages = []
-
+def _classify_extensions(suffixes: Iterable[str]) -> list[str]:
+    """Map file suffixes to the top 3 languages in priority order."""
     extensions = {
         ".py": "python",
         ".ts": "typescript",
@@ -88,22 +87,21 @@ def detect_languages(project_dir: Path) -> list[str]:
         ".java": "java",
         ".swift": "swift",
     }
-
-    found = set()
-    for ext, lang in extensions.items():
-        # Check if any files with this extension exist
-        if list(project_dir.glob(f"**/*{ext}"))[:1]:
-            found.add(lang)
+    found = {extensions[suffix] for suffix in suffixes if suffix in extensions}
 
     # Prioritize certain languages
     priority = ["python", "typescript", "rust", "go", "javascript", "java", "swift", "zig"]
-    for lang in priority:
-        if lang in found:
-            languages.append(lang)
+    languages = [lang for lang in priority if lang in found]
 
     return languages[:3]  # Limit to top 3
 
 
+def detect_languages(project_dir: Path) -> list[str]:
+    """Detect programming languages used in the project."""
+    # Walk the tree once rather than globbing once per extension
+    return _classify_extensions(path.suffix for path in project_dir.rglob("*"))
+
+
 def check_cli_available(command: str) -> bool:
     """Check if a CLI command is available."""
     return shutil.which(command) is not None
@@ -218,15 +216,15 @@ degradation:
 def create_settings_file(config: WizardConfig, project_dir: Path) -> None:
     """Create or update .claude/settings.json with hooks."""
     claude_dir = project_dir / ".claude"
+    claude_dir.mkdir(parents=True, exist_ok=True)
     settings_file = claude_dir / "settings.json"
 
     # Load existing settings or create new
     settings: dict[str, Any] = {}
-    if settings_file.exists():
-        try:
-            settings = json.loads(settings_file.read_text())
-        except json.JSONDecodeError:
-            pass
+    try:
+        settings = json.loads(settings_file.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+        pass
 
     # Add hooks configuration
     settings["hooks"] = {
@@ -9,6 +9,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -26,7 +27,13 @@ def get_task_list_id(project_dir: Path, config_id: str | None = None) -> str:
     if config_id:
         return config_id
     # Generate from project path
-    return hashlib.sha256(str(project_dir.resolve()).encode()).hexdigest()[:12]
+    return _hash_project(str(project_dir.resolve()))
+
+
+@lru_cache(maxsize=256)
+def _hash_project(project_str: str) -> str:
+    """Return the 12-char task list hash for a resolved project path."""
+    return hashlib.sha256(project_str.encode()).hexdigest()[:12]
 
 
 def get_tasks_dir(task_list_id: str) -> Path:
@@ -50,18 +57,23 @@ def list_tasks(task_list_id: str) -> list[dict]:
         List of task dictionaries
     """
     tasks_dir = get_tasks_dir(task_list_id)
-    if not tasks_dir.exists():
-        return []
 
     tasks = []
-    for task_file in tasks_dir.glob("*.json"):
-        if task_file.name.startswith("."):
-            continue
-        try:
-            with open(task_file) as f:
-                tasks.append(json.load(f))
-        except (json.JSONDecodeError, OSError):
-            continue
+    try:
+        # scandir's cached d_type avoids a stat() per entry
+        with os.scandir(tasks_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.name.endswith(".json"):
+                    continue
+                if not entry.is_file():
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        tasks.append(json.load(f))
+                except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                    continue
+    except OSError:
+        return []
     return tasks
 
 
@@ -42,7 +42,7 @@ class DegradationAction(Enum):
     FAIL = "fail"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainlinkConfig:
     """Chainlink-specific configuration."""
 
@@ -52,7 +52,7 @@ class ChainlinkConfig:
     rules_path: str = ".claude/rules/"
 
 
-@dataclass
+@dataclass(slots=True)
 class BeadsConfig:
     """Beads-specific configuration."""
 
@@ -61,7 +61,7 @@ class BeadsConfig:
     prefix: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BuiltinConfig:
     """Claude Code builtin task system configuration."""
 
@@ -69,7 +69,7 @@ class BuiltinConfig:
     auto_set_env: bool = True  # Auto-set CLAUDE_CODE_TASK_LIST_ID env var
 
 
-@dataclass
+@dataclass(slots=True)
 class AdversarialConfig:
     """Adversarial review configuration."""
 
@@ -80,7 +80,7 @@ class AdversarialConfig:
     fresh_context: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecConfig:
     """Specification configuration."""
 
@@ -89,7 +89,7 @@ class SpecConfig:
     require_issue_link: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ADRConfig:
     """ADR configuration."""
 
@@ -98,10 +98,12 @@ class ADRConfig:
     template: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TestingConfig:
     """Testing configuration."""
 
+    __test__ = False  # Not a pytest test class despite the name
+
     unit_framework: str | None = None
     integration_framework: str | None = None
     property_framework: str | None = None
@@ -179,7 +181,12 @@ class DPConfig:
             return cls()
 
         with open(path) as f:
-            data = yaml.safe_load(f) or {}
+            return cls.loads(f.read())
+
+    @classmethod
+    def loads(cls, text: str) -> DPConfig:
+        """Parse configuration from a YAML string, with automatic migration if needed."""
+        data = yaml.safe_load(text) or {}
 
         version = data.get("version", "1.0")
 
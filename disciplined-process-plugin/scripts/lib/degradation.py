@@ -22,7 +22,13 @@ from pathlib import Path
 from typing import Any, Callable
 
 from .config import DPConfig, DegradationAction, TaskTracker, get_config
-from .providers import check_cli_available, check_provider_available, feedback, get_project_dir
+from .providers import (
+    beads_dir_exists,
+    check_cli_available,
+    check_provider_available,
+    feedback,
+    get_project_dir,
+)
 
 
 class DegradationLevel(Enum):
@@ -35,7 +41,7 @@ class DegradationLevel(Enum):
     RECOVERY = auto()  # Attempting repair
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthStatus:
     """Health status of a component."""
 
@@ -47,7 +53,7 @@ class HealthStatus:
     recovery_succeeded: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemState:
     """Overall system state."""
 
@@ -67,17 +73,11 @@ def get_state_file() -> Path:
 
 def load_state() -> SystemState:
     """Load system state from file or return default."""
-    state_file = get_state_file()
-
-    if state_file.exists():
-        try:
-            with open(state_file) as f:
-                data = json.load(f)
-            return _deserialize_state(data)
-        except (json.JSONDecodeError, KeyError, OSError):
-            pass
-
-    return SystemState(level=DegradationLevel.FULL)
+    try:
+        return _deserialize_state(json.loads(get_state_file().read_bytes()))
+    except (KeyError, ValueError, OSError):
+        # ValueError also covers JSON/UTF-8 decode errors and bad timestamps
+        return SystemState(level=DegradationLevel.FULL)
 
 
 def save_state(state: SystemState) -> None:
@@ -286,6 +286,7 @@ def _recover_task_tracker() -> bool:
                     timeout=30,
                     cwd=project_dir,
                 )
+                beads_dir_exists.cache_clear()
                 return (project_dir / ".beads").exists()
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 return False
@@ -13,6 +13,28 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+# Spec references as they appear in task titles and descriptions
+_SPEC_REF_PATTERN = re.compile(r"SPEC-\d+\.\d+", re.IGNORECASE)
+
+# Verification-criteria markers, matched in a single pass over a description
+_CRITERIA_PATTERN = re.compile(
+    r"(?P<acceptance>acceptance\s+criteria:)"
+    r"|(?P<trace>@trace\s+SPEC-\d+\.\d+)"
+    r"|(?P<must_have>@must_have:)"
+    r"|(?P<success>success\s+criteria:)"
+    r"|(?P<done>done\s+(?:when|criteria):)",
+    re.IGNORECASE,
+)
+
+# Criteria type reported for each marker, highest priority first
+_CRITERIA_TYPES = {
+    "acceptance": "Acceptance Criteria",
+    "trace": "Spec Trace",
+    "must_have": "Must-Have",
+    "success": "Success Criteria",
+    "done": "Done Criteria",
+}
+
 
 class ValidationStatus(Enum):
     """Outcome of plan validation."""
@@ -22,7 +44,7 @@ class ValidationStatus(Enum):
     FAIL = "fail"  # Blocking issues found
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CoverageResult:
     """Result of checking if a spec has an implementing task."""
 
@@ -32,7 +54,7 @@ class CoverageResult:
     task_id: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TaskCompletenessResult:
     """Result of checking if a task has verification criteria."""
 
@@ -42,62 +64,146 @@ class TaskCompletenessResult:
     criteria_type: str = ""  # "acceptance criteria", "spec trace", "must_have"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DependencyResult:
     """Result of checking task dependencies."""
 
     is_valid: bool
     has_cycles: bool
-    missing_refs: list[str] = field(default_factory=list)
-    cycles: list[str] = field(default_factory=list)
+    missing_refs: tuple[str, ...] = ()
+    cycles: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any sequence but store tuples so results stay hashable
+        object.__setattr__(self, "missing_refs", tuple(self.missing_refs))
+        object.__setattr__(self, "cycles", tuple(self.cycles))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlanValidationResult:
     """Complete plan validation result."""
 
     status: ValidationStatus
-    coverage: list[CoverageResult] = field(default_factory=list)
-    completeness: list[TaskCompletenessResult] = field(default_factory=list)
+    coverage: tuple[CoverageResult, ...] = ()
+    completeness: tuple[TaskCompletenessResult, ...] = ()
     dependencies: DependencyResult | None = None
-    warnings: list[str] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
+    errors: tuple[str, ...] = ()
 
+    def __post_init__(self) -> None:
+        # Accept any sequence but store tuples so results stay hashable
+        for name in ("coverage", "completeness", "warnings", "errors"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
 
-# @trace SPEC-06.10, SPEC-06.11
-def check_requirement_coverage(
-    specs: list[dict[str, Any]],
-    tasks: list[dict[str, Any]],
-) -> list[CoverageResult]:
-    """
-    Check if specs have implementing tasks.
 
-    Args:
-        specs: List of spec dicts with id, title, file
-        tasks: List of task dicts with id, title, description
+@dataclass(slots=True)
+class _PlanIndex:
+    """Per-task facts gathered in one pass and shared by the plan checks."""
 
-    Returns:
-        List of CoverageResult for each spec
-    """
+    task_ids: frozenset[Any]
+    # Upper-cased "title\ndescription" per task, for non-standard spec IDs
+    task_texts: list[tuple[Any, str]] = field(default_factory=list)
+    # Spec ID -> first task that references it
+    spec_refs: dict[str, Any] = field(default_factory=dict)
+    completeness: list[TaskCompletenessResult] = field(default_factory=list)
+    # Each task points at the tasks that list it in blockedBy
+    graph: dict[str, list[str]] = field(default_factory=dict)
+    referenced: set[str] = field(default_factory=set)
+    self_refs: list[str] = field(default_factory=list)
+
+
+def _classify_criteria(description: str) -> str:
+    """Return the highest-priority criteria type in a description, or ""."""
+    # Every marker contains "@" or ":", so most plain prose skips the regex
+    if "@" not in description and ":" not in description:
+        return ""
+    found = {m.lastgroup for m in _CRITERIA_PATTERN.finditer(description)}
+    return next(
+        (label for group, label in _CRITERIA_TYPES.items() if group in found),
+        "",
+    )
+
+
+def _new_index(tasks: list[dict[str, Any]]) -> _PlanIndex:
+    """Return an empty index over the plan's task IDs."""
+    return _PlanIndex(
+        task_ids=frozenset(task.get("id") for task in tasks),
+        graph={task.get("id", ""): [] for task in tasks},
+    )
+
+
+def _index_spec_refs(index: _PlanIndex, task: dict[str, Any]) -> None:
+    """Record a task's text and the spec IDs it mentions."""
+    # Title or description may be missing or None
+    title = task.get("title") or ""
+    description = task.get("description") or ""
+    task_text = (title + "\n" + description).upper()
+    index.task_texts.append((task.get("id"), task_text))
+    # Plain substring search runs in C; most tasks never reach the regex
+    if "SPEC-" in task_text:
+        # The first task mentioning a spec claims it
+        for ref in _SPEC_REF_PATTERN.findall(task_text):
+            index.spec_refs.setdefault(ref, task.get("id"))
+
+
+def _task_completeness(task: dict[str, Any]) -> TaskCompletenessResult:
+    """Classify a task's verification criteria."""
+    criteria_type = _classify_criteria(task.get("description") or "")
+    return TaskCompletenessResult(
+        task_id=task.get("id", ""),
+        task_title=task.get("title", ""),
+        has_criteria=bool(criteria_type),
+        criteria_type=criteria_type,
+    )
+
+
+def _index_dependencies(index: _PlanIndex, task: dict[str, Any]) -> None:
+    """Record a task's dependency references and blockedBy edges."""
+    task_id = task.get("id", "")
+    blocked_by = task.get("blockedBy", []) or []
+    blocks = task.get("blocks", []) or []
+    index.referenced.update(blocked_by, blocks)
+
+    # Self-references are reported directly rather than as cycles
+    if task_id in blocked_by or task_id in blocks:
+        index.self_refs.append(task_id)
+
+    # Only blockedBy edges form the graph; blocks lists are informational
+    for dep_id in blocked_by:
+        if dep_id != task_id and dep_id in index.task_ids:
+            index.graph[dep_id].append(task_id)
+
+
+def _index_plan(tasks: list[dict[str, Any]]) -> _PlanIndex:
+    """Walk the task list once, collecting what every check needs."""
+    index = _new_index(tasks)
+    for task in tasks:
+        _index_spec_refs(index, task)
+        index.completeness.append(_task_completeness(task))
+        _index_dependencies(index, task)
+    return index
+
+
+def _coverage(
+    specs: list[dict[str, Any]],
+    index: _PlanIndex,
+) -> list[CoverageResult]:
+    """Resolve each spec against the indexed task references."""
     results: list[CoverageResult] = []
 
     for spec in specs:
         spec_id = spec.get("id", "")
         spec_title = spec.get("title", "")
+        key = spec_id.upper()
 
-        # Look for task that references this spec
-        covering_task = None
-        for task in tasks:
-            task_text = (
-                task.get("title", "")
-                + " "
-                + task.get("description", "")
-            ).upper()
-
-            # Check for @trace marker or spec ID mention
-            if spec_id.upper() in task_text:
-                covering_task = task.get("id")
-                break
+        if _SPEC_REF_PATTERN.fullmatch(key):
+            covering_task = index.spec_refs.get(key)
+        else:
+            # Non-standard IDs fall back to a plain substring mention
+            covering_task = next(
+                (task_id for task_id, text in index.task_texts if key in text),
+                None,
+            )
 
         results.append(
             CoverageResult(
@@ -111,6 +217,47 @@ def check_requirement_coverage(
     return results
 
 
+def _dependencies(index: _PlanIndex) -> DependencyResult:
+    """Check the indexed dependency graph for cycles and dangling refs."""
+    # IDs may mix strings and numbers, so order them by their text
+    missing_refs = sorted(index.referenced - index.task_ids, key=str)
+    cycles = [f"{task_id} references itself" for task_id in index.self_refs]
+
+    for component in _strongly_connected_components(index.graph):
+        if len(component) > 1:
+            cycles.append(_describe_cycle(index.graph, component))
+
+    has_cycles = bool(cycles)
+
+    return DependencyResult(
+        is_valid=not has_cycles and not missing_refs,
+        has_cycles=has_cycles,
+        missing_refs=tuple(missing_refs),
+        cycles=tuple(cycles),
+    )
+
+
+# @trace SPEC-06.10, SPEC-06.11
+def check_requirement_coverage(
+    specs: list[dict[str, Any]],
+    tasks: list[dict[str, Any]],
+) -> list[CoverageResult]:
+    """
+    Check if specs have implementing tasks.
+
+    Args:
+        specs: List of spec dicts with id, title, file
+        tasks: List of task dicts with id, title, description
+
+    Returns:
+        List of CoverageResult for each spec
+    """
+    index = _new_index(tasks)
+    for task in tasks:
+        _index_spec_refs(index, task)
+    return _coverage(specs, index)
+
+
 # @trace SPEC-06.20, SPEC-06.21
 def check_task_completeness(
     tasks: list[dict[str, Any]],
@@ -129,51 +276,74 @@ def check_task_completeness(
     Returns:
         List of TaskCompletenessResult for each task
     """
-    results: list[TaskCompletenessResult] = []
-
-    for task in tasks:
-        task_id = task.get("id", "")
-        task_title = task.get("title", "")
-        description = task.get("description", "")
-
-        has_criteria = False
-        criteria_type = ""
-
-        # Check for acceptance criteria
-        if re.search(r"acceptance\s+criteria:", description, re.IGNORECASE):
-            has_criteria = True
-            criteria_type = "Acceptance Criteria"
-
-        # Check for @trace markers
-        elif re.search(r"@trace\s+SPEC-\d+\.\d+", description, re.IGNORECASE):
-            has_criteria = True
-            criteria_type = "Spec Trace"
-
-        # Check for @must_have
-        elif re.search(r"@must_have:", description, re.IGNORECASE):
-            has_criteria = True
-            criteria_type = "Must-Have"
-
-        # Check for success criteria
-        elif re.search(r"success\s+criteria:", description, re.IGNORECASE):
-            has_criteria = True
-            criteria_type = "Success Criteria"
-
-        # Check for done criteria
-        elif re.search(r"done\s+(?:when|criteria):", description, re.IGNORECASE):
-            has_criteria = True
-            criteria_type = "Done Criteria"
-
-        results.append(
-            TaskCompletenessResult(
-                task_id=task_id,
-                task_title=task_title,
-                has_criteria=has_criteria,
-                criteria_type=criteria_type,
-            )
-        )
-
-    return results
+    return [_task_completeness(task) for task in tasks]
+
+
+def _strongly_connected_components(
+    graph: dict[str, list[str]],
+) -> list[list[str]]:
+    """Return the SCCs of graph using an iterative Tarjan traversal."""
+    index: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        frames = [(root, iter(graph[root]))]
+
+        while frames:
+            node, successors = frames[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    frames.append((succ, iter(graph[succ])))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                frames.pop()
+                if frames:
+                    parent = frames[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: list[str] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _describe_cycle(graph: dict[str, list[str]], component: list[str]) -> str:
+    """Render the shortest cycle through the component's root task."""
+    members = set(component)
+    start = component[-1]
+    parents: dict[str, str] = {}
+    queue = [start]
+    for node in queue:
+        for succ in graph[node]:
+            if succ == start:
+                path: list[str] = []
+                while node != start:
+                    path.append(node)
+                    node = parents[node]
+                return " -> ".join([start, *reversed(path), start])
+            if succ in members and succ not in parents:
+                parents[succ] = node
+                queue.append(succ)
+    return " -> ".join(component)  # unreachable for a genuine SCC
 
 
 # @trace SPEC-06.30, SPEC-06.31
@@ -194,71 +364,10 @@ def check_dependencies(
     Returns:
         DependencyResult with validation status
     """
-    task_ids = {task.get("id") for task in tasks}
-    missing_refs: list[str] = []
-    cycles: list[str] = []
-    has_cycles = False
-
-    # Build dependency graph
-    graph: dict[str, set[str]] = {}
+    index = _new_index(tasks)
     for task in tasks:
-        task_id = task.get("id", "")
-        blocked_by = task.get("blockedBy", []) or []
-        blocks = task.get("blocks", []) or []
-
-        if task_id not in graph:
-            graph[task_id] = set()
-
-        # Check blockedBy references
-        for dep_id in blocked_by:
-            if dep_id == task_id:
-                cycles.append(f"{task_id} references itself")
-                has_cycles = True
-            elif dep_id not in task_ids:
-                missing_refs.append(dep_id)
-            else:
-                graph[task_id].add(dep_id)
-
-        # Check blocks references
-        for dep_id in blocks:
-            if dep_id == task_id:
-                cycles.append(f"{task_id} references itself")
-                has_cycles = True
-            elif dep_id not in task_ids:
-                missing_refs.append(dep_id)
-
-    # Detect cycles using DFS
-    def has_cycle_from(start: str, visited: set[str], path: set[str]) -> bool:
-        if start in path:
-            return True
-        if start in visited:
-            return False
-
-        visited.add(start)
-        path.add(start)
-
-        for neighbor in graph.get(start, set()):
-            if has_cycle_from(neighbor, visited, path):
-                cycles.append(f"{start} -> {neighbor} (cycle)")
-                return True
-
-        path.remove(start)
-        return False
-
-    visited: set[str] = set()
-    for task_id in graph:
-        if has_cycle_from(task_id, visited, set()):
-            has_cycles = True
-            break
-
-    is_valid = not has_cycles and len(missing_refs) == 0
-
-    return DependencyResult(
-        is_valid=is_valid,
-        has_cycles=has_cycles,
-        missing_refs=list(set(missing_refs)),
-        cycles=cycles,
-    )
+        _index_dependencies(index, task)
+    return _dependencies(index)
 
 
 # @trace SPEC-06.50
@@ -279,20 +388,23 @@ def validate_plan(
     warnings: list[str] = []
     errors: list[str] = []
 
+    # Walk the tasks once and share the result across all checks
+    index = _index_plan(tasks)
+
     # Check requirement coverage
-    coverage = check_requirement_coverage(specs, tasks)
+    coverage = _coverage(specs, index)
     orphan_specs = [c for c in coverage if not c.is_covered]
     for orphan in orphan_specs:
         warnings.append(f"{orphan.spec_id} has no implementing task")
 
     # Check task completeness
-    completeness = check_task_completeness(tasks)
+    completeness = index.completeness
     incomplete_tasks = [t for t in completeness if not t.has_criteria]
     for task in incomplete_tasks:
         warnings.append(f"Task {task.task_id} missing verification criteria")
 
     # Check dependencies
-    dependencies = check_dependencies(tasks)
+    dependencies = _dependencies(index)
     if dependencies.has_cycles:
         errors.append("Circular dependency detected")
     for ref in dependencies.missing_refs:
@@ -308,11 +420,11 @@ def validate_plan(
 
     return PlanValidationResult(
         status=status,
-        coverage=coverage,
-        completeness=completeness,
+        coverage=tuple(coverage),
+        completeness=tuple(completeness),
         dependencies=dependencies,
-        warnings=warnings,
-        errors=errors,
+        warnings=tuple(warnings),
+        errors=tuple(errors),
     )
 
 
@@ -351,29 +463,29 @@ def format_validation_result(result: PlanValidationResult) -> str:
     if result.dependencies:
         lines.append("Dependencies:")
         if result.dependencies.is_valid:
-            lines.append("  [ok] No circular dependencies")
-            lines.append("  [ok] All references valid")
+            lines.extend(
+                ("  [ok] No circular dependencies", "  [ok] All references valid")
+            )
         else:
             if result.dependencies.has_cycles:
                 lines.append("  [FAIL] Circular dependency detected")
-                for cycle in result.dependencies.cycles:
-                    lines.append(f"    - {cycle}")
-            for ref in result.dependencies.missing_refs:
-                lines.append(f"  [FAIL] Missing reference: {ref}")
+                lines.extend(f"    - {cycle}" for cycle in result.dependencies.cycles)
+            lines.extend(
+                f"  [FAIL] Missing reference: {ref}"
+                for ref in result.dependencies.missing_refs
+            )
         lines.append("")
 
     # Warnings
     if result.warnings:
         lines.append("Warnings:")
-        for warning in result.warnings:
-            lines.append(f"  - {warning}")
+        lines.extend(f"  - {warning}" for warning in result.warnings)
         lines.append("")
 
     # Errors
     if result.errors:
         lines.append("Errors:")
-        for error in result.errors:
-            lines.append(f"  - {error}")
+        lines.extend(f"  - {error}" for error in result.errors)
         lines.append("")
 
     # Summary
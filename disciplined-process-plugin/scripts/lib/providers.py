@@ -10,8 +10,10 @@ import json
 import os
 import shutil
 import subprocess
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -19,7 +21,7 @@ from .config import DPConfig, DegradationAction, TaskTracker, get_config
 from . import builtin_provider
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderStatus:
     """Status of a task tracker provider."""
 
@@ -28,6 +30,13 @@ class ProviderStatus:
     ready_count: int | None = None
 
 
+# How long a missing-provider warning stays quiet before repeating
+_WARN_INTERVAL = timedelta(hours=24)
+
+# Shared result for providers that need no CLI; safe to reuse since it is frozen
+_ALWAYS_AVAILABLE = ProviderStatus(True)
+
+
 def get_project_dir() -> Path:
     """Get the project directory from environment or current working directory."""
     return Path(os.environ.get("CLAUDE_PROJECT_DIR", "."))
@@ -38,11 +47,26 @@ def get_warn_file() -> Path:
     return get_project_dir() / ".claude" / ".dp-provider-warned"
 
 
+@lru_cache(maxsize=128)
 def check_cli_available(command: str) -> bool:
-    """Check if a CLI command is available on the system."""
+    """Check if a CLI command is available on the system.
+
+    Cached for the life of the process: hooks are short-lived, and each
+    lookup otherwise walks every directory on PATH.
+    """
     return shutil.which(command) is not None
 
 
+@lru_cache(maxsize=64)
+def beads_dir_exists(project_dir: Path) -> bool:
+    """Check if beads has been initialized in a project directory.
+
+    Cached per process; code that runs 'bd init' itself must call
+    beads_dir_exists.cache_clear() afterwards.
+    """
+    return (project_dir / ".beads").is_dir()
+
+
 def check_provider_available(tracker: TaskTracker, project_dir: Path | None = None) -> ProviderStatus:
     """
     Check if a task tracker provider is available and configured.
@@ -61,8 +85,7 @@ def check_provider_available(tracker: TaskTracker, project_dir: Path | None = No
         case TaskTracker.BEADS:
             if not check_cli_available("bd"):
                 return ProviderStatus(False, "'bd' CLI not found. Run 'pip install beads' or change provider.")
-            beads_dir = project_dir / ".beads"
-            if not beads_dir.is_dir():
+            if not beads_dir_exists(project_dir):
                 return ProviderStatus(False, ".beads/ not initialized. Run 'bd init' in project root.")
             return ProviderStatus(True)
 
@@ -86,7 +109,7 @@ def check_provider_available(tracker: TaskTracker, project_dir: Path | None = No
 
         case TaskTracker.MARKDOWN:
             # Always available - uses local files
-            return ProviderStatus(True)
+            return _ALWAYS_AVAILABLE
 
         case TaskTracker.BUILTIN:
             # Always available - uses Claude Code's native task system
@@ -106,10 +129,10 @@ def check_provider_available(tracker: TaskTracker, project_dir: Path | None = No
             # Set env var if configured
             if config.builtin.auto_set_env:
                 builtin_provider.ensure_env_set(task_list_id)
-            return ProviderStatus(True)
+            return _ALWAYS_AVAILABLE
 
         case TaskTracker.NONE:
-            return ProviderStatus(True)
+            return _ALWAYS_AVAILABLE
 
         case _:
             return ProviderStatus(False, f"Unknown provider: {tracker}")
@@ -124,15 +147,14 @@ def should_warn_about_provider(warn_file: Path | None = None) -> bool:
     if warn_file is None:
         warn_file = get_warn_file()
 
-    if not warn_file.exists():
+    # A single stat both checks existence and reads the mtime
+    try:
+        mtime = warn_file.stat().st_mtime
+    except OSError:
         return True
 
     # Check if warning is older than 24 hours
-    try:
-        mtime = datetime.fromtimestamp(warn_file.stat().st_mtime)
-        return datetime.now() - mtime > timedelta(hours=24)
-    except (OSError, ValueError):
-        return True
+    return time.time() - mtime > _WARN_INTERVAL.total_seconds()
 
 
 def mark_provider_warned(warn_file: Path | None = None) -> None:
@@ -241,7 +263,7 @@ def sync_tracker(tracker: TaskTracker, project_dir: Path | None = None) -> bool:
     try:
         match tracker:
             case TaskTracker.BEADS:
-                if check_cli_available("bd") and (project_dir / ".beads").is_dir():
+                if check_cli_available("bd") and beads_dir_exists(project_dir):
                     result = subprocess.run(
                         ["bd", "sync"],
                         capture_output=True,
@@ -8,12 +8,81 @@ Verifies that work achieves its intended goal, not just that tasks were complete
 
 from __future__ import annotations
 
+import ast
+import os
 import re
-from dataclasses import dataclass, field
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Headings that introduce a bullet list, compared against whitespace-normalized lines
+_ACCEPTANCE_HEADING = "acceptance criteria:"
+_SUCCESS_HEADING = "success criteria:"
+_ARTIFACTS_HEADINGS = ("artifact:", "artifacts:")
+
+# @must_have fields
+_MUST_HAVE_TRUTH_PATTERN = re.compile(r"truth:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_MUST_HAVE_ARTIFACT_PATTERN = re.compile(r"artifact:\s*(.+?)(?:\n|$)", re.IGNORECASE)
+_MUST_HAVE_LINK_PATTERN = re.compile(
+    r"link:\s*(.+?)\s*->\s*(.+?)(?:\n|$)", re.IGNORECASE
+)
+
+# Artifact count from which verify_task checks artifacts on a thread pool
+_PARALLEL_ARTIFACT_THRESHOLD = 4
+
+# Files larger than this are line-counted in chunks rather than read whole
+_STREAM_THRESHOLD_BYTES = 64 * 1024
+_STREAM_CHUNK_BYTES = 1024 * 1024
+
+# Stub heuristics used by detect_stub
+_STUB_THRESHOLD_LINES = 10
+_DEFINITION_PATTERN = re.compile(
+    r"(?:def|function|class|const|let|var)\s+\w+.*(?::|=>|{)"
+)
+_RETURN_PATTERN = re.compile(r"\breturn\b")
+_RETURN_VALUE_PATTERN = re.compile(r"return\s+(.+)")
+
+# Stub markers, counted in a single pass over the file
+_STUB_PATTERN = re.compile(
+    r"^\s*pass\s*$"
+    r"|^\s*\.\.\.\s*$"  # Python ellipsis
+    r"|raise\s+NotImplementedError"
+    r'|throw\s+new\s+Error\s*\(\s*["\']Not\s+implemented'
+    r"|TODO:\s*implement"
+    r"|FIXME:\s*implement"
+    r"|>\s*TODO"  # JSX placeholder
+    r"|>\s*PLACEHOLDER"
+    r"|>\s*Coming soon",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Components whose body is nothing but placeholder text
+_PLACEHOLDER_PATTERN = re.compile(
+    r"^(?:export\s+)?(?:function|const|class)\s+\w+.*\{\s*(?:return\s+)?(?:<div>|<>)?\s*(?:TODO|PLACEHOLDER|Coming soon)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# Import statements in Python and JS/TS sources, matched in a single pass.
+# import/from statements are anchored to the start of a line so the engine
+# rejects most positions at once; require() calls can appear mid-line.
+# The last group of each branch tells _scan_imports which form matched.
+_IMPORT_PATTERN = re.compile(
+    r"^[ \t]*(?:"
+    r"from\s+['\"]?(?P<from_module>[\w./@-]+)['\"]?\s+import\s+(?P<from_names>[^#\n]*)"
+    r"|import\s+(?:type\s+)?(?:(?P<default_name>\w+)\s*,?\s*)?(?:\{(?P<named>[^}]*)\}\s*)?"
+    r"(?:\*\s*as\s+\w+\s+)?from\s+['\"](?P<es_module>[^'\"]+)['\"]"
+    r"|import\s+['\"](?P<side_effect>[^'\"]+)['\"]"
+    r"|import\s+(?P<modules>[\w.]+(?:[ \t]*,[ \t]*[\w.]+)*)"
+    r")"
+    r"|\brequire\s*\(\s*['\"](?P<required>[^'\"]+)['\"]",
+    re.IGNORECASE | re.MULTILINE,
+)
+_WORD_PATTERN = re.compile(r"\w+")
+
 
 class VerificationLevel(Enum):
     """Levels of verification depth."""
@@ -31,7 +100,7 @@ class VerificationStatus(Enum):
     FAILED = "failed"  # Verification errors occurred
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TruthResult:
     """Result of verifying a truth (observable behavior)."""
 
@@ -39,7 +108,7 @@ class TruthResult:
     status: str  # "ok", "fail", "?"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArtifactResult:
     """Result of verifying an artifact exists with substance."""
 
@@ -51,7 +120,7 @@ class ArtifactResult:
     details: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LinkResult:
     """Result of verifying a key link between artifacts."""
 
@@ -62,16 +131,49 @@ class LinkResult:
     details: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VerificationResult:
     """Complete verification result for a task."""
 
     task_id: str
     status: VerificationStatus
-    truths: list[TruthResult] = field(default_factory=list)
-    artifacts: list[ArtifactResult] = field(default_factory=list)
-    links: list[LinkResult] = field(default_factory=list)
-    errors: list[str] = field(default_factory=list)
+    truths: tuple[TruthResult, ...] = ()
+    artifacts: tuple[ArtifactResult, ...] = ()
+    links: tuple[LinkResult, ...] = ()
+    errors: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any sequence but store tuples so results stay hashable
+        for name in ("truths", "artifacts", "links", "errors"):
+            object.__setattr__(self, name, tuple(getattr(self, name)))
+
+
+def _bullets_under(lines: list[str], heading: str | tuple[str, ...]) -> list[str]:
+    """
+    Return the bullet items under the first heading line that has any.
+
+    A heading line ends with ``heading`` (case-insensitive, any run of
+    whitespace between words). Blank lines inside the list are skipped and
+    the first non-bullet line ends it.
+    """
+    for i, line in enumerate(lines):
+        stripped = line.rstrip()
+        if not stripped.endswith(":"):
+            continue
+        if not " ".join(stripped.split()).lower().endswith(heading):
+            continue
+
+        items: list[str] = []
+        for following in lines[i + 1 :]:
+            following = following.strip()
+            if not following:
+                continue
+            if not following.startswith(("-", "*")):
+                break
+            items.append(following.lstrip("-* ").strip())
+        if items:
+            return [item for item in items if item]
+    return []
 
 
 # @trace SPEC-05.10, SPEC-05.11
@@ -84,45 +186,19 @@ def extract_truths_from_description(description: str) -> list[str]:
     - "@must_have:" sections with "truth:" fields
     - "Success Criteria:" sections
     """
-    truths: list[str] = []
+    lines = description.splitlines()
 
     # Pattern 1: Acceptance Criteria bullet points
-    ac_match = re.search(
-        r"Acceptance\s+Criteria:\s*\n((?:\s*[-*]\s*.+\n?)+)",
-        description,
-        re.IGNORECASE,
-    )
-    if ac_match:
-        bullets = ac_match.group(1)
-        for line in bullets.split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                truth = line.lstrip("-* ").strip()
-                if truth:
-                    truths.append(truth)
+    truths = _bullets_under(lines, _ACCEPTANCE_HEADING)
 
     # Pattern 2: @must_have truth: fields
-    must_have_truths = re.findall(
-        r"truth:\s*(.+?)(?:\n|$)",
-        description,
-        re.IGNORECASE,
-    )
+    must_have_truths = _MUST_HAVE_TRUTH_PATTERN.findall(description)
     truths.extend([t.strip() for t in must_have_truths if t.strip()])
 
     # Pattern 3: Success Criteria
-    sc_match = re.search(
-        r"Success\s+Criteria:\s*\n((?:\s*[-*]\s*.+\n?)+)",
-        description,
-        re.IGNORECASE,
-    )
-    if sc_match:
-        bullets = sc_match.group(1)
-        for line in bullets.split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                truth = line.lstrip("-* ").strip()
-                if truth and truth not in truths:
-                    truths.append(truth)
+    for truth in _bullets_under(lines, _SUCCESS_HEADING):
+        if truth not in truths:
+            truths.append(truth)
 
     return truths
 
@@ -134,11 +210,7 @@ def extract_must_have_artifacts(description: str) -> list[str]:
 
     Looks for: artifact: <path>
     """
-    artifacts = re.findall(
-        r"artifact:\s*(.+?)(?:\n|$)",
-        description,
-        re.IGNORECASE,
-    )
+    artifacts = _MUST_HAVE_ARTIFACT_PATTERN.findall(description)
     return [a.strip() for a in artifacts if a.strip()]
 
 
@@ -150,52 +222,132 @@ def extract_must_have_links(description: str) -> list[tuple[str, str]]:
     Looks for: link: from -> to
     """
     links: list[tuple[str, str]] = []
-    link_matches = re.findall(
-        r"link:\s*(.+?)\s*->\s*(.+?)(?:\n|$)",
-        description,
-        re.IGNORECASE,
-    )
+    link_matches = _MUST_HAVE_LINK_PATTERN.findall(description)
     for from_part, to_part in link_matches:
         links.append((from_part.strip(), to_part.strip()))
     return links
 
 
+@dataclass(frozen=True, slots=True)
+class _FileAnalysis:
+    """Line count and stub verdict for one version of a file."""
+
+    line_count: int
+    is_stub: bool
+
+
+def _stat_key(path: Path) -> tuple[str, int, int] | None:
+    """Return (path, mtime_ns, size) for a regular file, or None if there isn't one."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def _read_file(path_str: str, size: int) -> bytes:
+    """Read a file whose size is already known from its stat key.
+
+    Path.read_bytes() would fstat the file again to size its buffer.
+    """
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _count_lines(raw: bytes) -> int:
+    """Count lines on the bytes rather than building a splitlines() list."""
+    line_count = raw.count(b"\n")
+    if raw and not raw.endswith(b"\n"):
+        line_count += 1
+    return line_count
+
+
+def _count_file_lines(path_str: str, size: int) -> int:
+    """Count a file's lines, streaming large files in fixed-size chunks.
+
+    Small files are read whole; larger ones (generated bundles, vendored
+    code) never hold more than one chunk in memory.
+    """
+    if size <= _STREAM_THRESHOLD_BYTES:
+        return _count_lines(_read_file(path_str, size)) if size else 0
+
+    line_count = 0
+    last = b""
+    fd = os.open(path_str, os.O_RDONLY)
+    try:
+        while chunk := os.read(fd, _STREAM_CHUNK_BYTES):
+            line_count += chunk.count(b"\n")
+            last = chunk[-1:]
+    finally:
+        os.close(fd)
+    if last and last != b"\n":
+        line_count += 1
+    return line_count
+
+
+@lru_cache(maxsize=4096)
+def _analyze_file(
+    path_str: str, mtime_ns: int, size: int, threshold_lines: int
+) -> _FileAnalysis:
+    """Read and analyze a file once per (mtime, size) version.
+
+    The artifact checks in a single verification often look at the same
+    file more than once; keying on the stat result means an edited file
+    is re-read while an unchanged one is not.
+    """
+    raw = _read_file(path_str, size)
+    return _FileAnalysis(
+        line_count=_count_lines(raw),
+        is_stub=_is_stub_content(raw.decode(), threshold_lines),
+    )
+
+
 # @trace SPEC-05.20
 def check_artifact_exists(path: Path) -> ArtifactResult:
     """Check if an artifact file exists."""
-    exists = path.exists() and path.is_file()
+    key = _stat_key(path)
+    if key is None:
+        return ArtifactResult(path=path, exists=False, is_substantive=False)
+    path_str, _, size = key
+    # Only the line count is needed here, so skip the stub heuristics
     return ArtifactResult(
-        path=path,
-        exists=exists,
-        is_substantive=False if not exists else True,
-        line_count=0 if not exists else len(path.read_text().splitlines()),
+        path=path, exists=True, line_count=_count_file_lines(path_str, size)
     )
 
 
 # @trace SPEC-05.21
 def check_artifact_substance(path: Path) -> ArtifactResult:
     """Check if artifact has substantive implementation (not a stub)."""
-    if not path.exists():
+    key = _stat_key(path)
+    if key is None:
         return ArtifactResult(
             path=path, exists=False, is_substantive=False, is_stub=False
         )
 
-    content = path.read_text()
-    lines = content.splitlines()
-    line_count = len(lines)
-    is_stub = detect_stub(path)
+    analysis = _analyze_file(*key, _STUB_THRESHOLD_LINES)
 
     return ArtifactResult(
         path=path,
         exists=True,
-        is_substantive=not is_stub,
-        is_stub=is_stub,
-        line_count=line_count,
+        is_substantive=not analysis.is_stub,
+        is_stub=analysis.is_stub,
+        line_count=analysis.line_count,
     )
 
 
 # @trace SPEC-05.22
-def detect_stub(path: Path, threshold_lines: int = 10) -> bool:
+def detect_stub(path: Path, threshold_lines: int = _STUB_THRESHOLD_LINES) -> bool:
     """
     Detect if a file is a stub/placeholder implementation.
 
@@ -205,10 +357,14 @@ def detect_stub(path: Path, threshold_lines: int = 10) -> bool:
     - Placeholder component text
     - Very short files (under threshold) with no real content
     """
-    if not path.exists():
+    key = _stat_key(path)
+    if key is None:
         return False
+    return _analyze_file(*key, threshold_lines).is_stub
+
 
-    content = path.read_text()
+def _is_stub_content(content: str, threshold_lines: int) -> bool:
+    """Apply the detect_stub heuristics to file content."""
     lines = [l.strip() for l in content.splitlines() if l.strip()]
 
     # Filter out empty lines and comments for analysis
@@ -219,18 +375,15 @@ def detect_stub(path: Path, threshold_lines: int = 10) -> bool:
     ]
 
     # Check for actual function/class definitions with bodies
-    has_definitions = bool(re.search(
-        r"(?:def|function|class|const|let|var)\s+\w+.*(?::|=>|{)",
-        content
-    ))
-    has_return_statements = bool(re.search(r"\breturn\b", content))
+    has_definitions = bool(_DEFINITION_PATTERN.search(content))
+    has_return_statements = bool(_RETURN_PATTERN.search(content))
 
     # Check line threshold - but allow files with real definitions
     if len(code_lines) < threshold_lines:
         # Allow small files that have actual definitions and returns
         if has_definitions and has_return_statements:
             # Further check: are returns meaningful (not just pass/None/TODO)?
-            meaningful_returns = re.findall(r"return\s+(.+)", content)
+            meaningful_returns = _RETURN_VALUE_PATTERN.findall(content)
             has_meaningful_return = any(
                 r.strip() not in ("None", "pass", "...", "")
                 and "NotImplemented" not in r
@@ -249,25 +402,21 @@ def detect_stub(path: Path, threshold_lines: int = 10) -> bool:
         if not has_meaningful_content:
             return True
 
-    # Stub patterns
-    stub_patterns = [
-        r"^\s*pass\s*$",
-        r"^\s*\.\.\.\s*$",  # Python ellipsis
-        r"raise\s+NotImplementedError",
-        r'throw\s+new\s+Error\s*\(\s*["\']Not\s+implemented',
-        r"TODO:\s*implement",
-        r"FIXME:\s*implement",
-        r">\s*TODO",  # JSX placeholder with space
-        r">TODO",  # JSX placeholder without space
-        r">\s*PLACEHOLDER",
-        r">\s*Coming soon",
-    ]
+    # Every stub marker and placeholder contains one of these literals, so
+    # cheap substring checks decide whether the regex scans can match at all
+    lowered = content.lower()
+    has_placeholder_text = (
+        "todo" in lowered or "placeholder" in lowered or "coming soon" in lowered
+    )
+    may_have_stub_markers = (
+        "pass" in lowered
+        or "..." in content
+        or "implement" in lowered
+        or (">" in content and has_placeholder_text)
+    )
 
     # Count stub indicators
-    stub_count = 0
-    for pattern in stub_patterns:
-        matches = re.findall(pattern, content, re.IGNORECASE | re.MULTILINE)
-        stub_count += len(matches)
+    stub_count = len(_STUB_PATTERN.findall(content)) if may_have_stub_markers else 0
 
     # If majority of non-trivial lines are stubs, it's a stub file
     non_trivial_lines = len([l for l in code_lines if len(l) > 5])
@@ -275,16 +424,149 @@ def detect_stub(path: Path, threshold_lines: int = 10) -> bool:
         return True
 
     # Check for placeholder-only content
-    placeholder_patterns = [
-        r"^(?:export\s+)?(?:function|const|class)\s+\w+.*\{\s*(?:return\s+)?(?:<div>|<>)?\s*(?:TODO|PLACEHOLDER|Coming soon)",
-    ]
-    for pattern in placeholder_patterns:
-        if re.search(pattern, content, re.IGNORECASE | re.MULTILINE):
-            return True
+    if has_placeholder_text and _PLACEHOLDER_PATTERN.search(content):
+        return True
 
     return False
 
 
+@dataclass(frozen=True, slots=True)
+class _ImportIndex:
+    """Modules and symbols imported by one file, lowercased."""
+
+    modules: frozenset[str]
+    # Symbols brought in by Python "from <module> import ...", per module
+    python_symbols: dict[str, frozenset[str]]
+    # Symbols brought in by JS/TS "import ... from", from any module
+    es_symbols: frozenset[str]
+
+
+_NO_IMPORTS = _ImportIndex(modules=frozenset(), python_symbols={}, es_symbols=frozenset())
+
+
+def _normalize_module(module: str) -> str:
+    """Lowercase a module specifier and drop a leading '.', '/' or './'."""
+    module = module.lower()
+    if module.startswith("."):
+        module = module[1:]
+    if module.startswith("/"):
+        module = module[1:]
+    return module
+
+
+def _add_python_module(modules: set[str], module: str) -> None:
+    """Record a dotted Python module and its top-level package.
+
+    "import utils.sub" also imports utils itself, so a link to utils.py
+    counts as connected.
+    """
+    modules.add(module)
+    head = module.lstrip(".").split(".", 1)[0]
+    if head:
+        modules.add(head)
+
+
+def _scan_imports(content: str) -> _ImportIndex:
+    """Collect every import in a file with one pass of _IMPORT_PATTERN."""
+    # Every branch needs one of these literals; most non-importing files
+    # are rejected by the substring search without running the regex
+    lowered = content.lower()
+    if "import" not in lowered and "require" not in lowered:
+        return _NO_IMPORTS
+
+    modules: set[str] = set()
+    python_symbols: dict[str, set[str]] = {}
+    es_symbols: set[str] = set()
+
+    for match in _IMPORT_PATTERN.finditer(content):
+        kind = match.lastgroup
+        # Every branch ends in a named group, so this never skips a real import
+        if kind is None:
+            continue
+        if kind == "from_names":
+            module = _normalize_module(match.group("from_module"))
+            _add_python_module(modules, module)
+            imported = match.group("from_names").lower()
+            python_symbols.setdefault(module, set()).update(_WORD_PATTERN.findall(imported))
+            # "from app import api" may import the api submodule itself
+            for part in imported.split(","):
+                name = _WORD_PATTERN.search(part)
+                if name:
+                    modules.add(name.group())
+        elif kind == "es_module":
+            modules.add(_normalize_module(match.group("es_module")))
+            default_name = match.group("default_name")
+            if default_name:
+                # "import X from ..." also counts as importing X itself
+                modules.add(default_name.lower())
+                es_symbols.add(default_name.lower())
+            named = match.group("named")
+            if named:
+                es_symbols.update(_WORD_PATTERN.findall(named.lower()))
+        elif kind == "modules":
+            for module in match.group("modules").split(","):
+                _add_python_module(modules, _normalize_module(module.strip()))
+        else:
+            modules.add(_normalize_module(match.group(kind)))
+
+    return _ImportIndex(
+        modules=frozenset(modules),
+        python_symbols={m: frozenset(s) for m, s in python_symbols.items()},
+        es_symbols=frozenset(es_symbols),
+    )
+
+
+def _scan_python_imports(content: str) -> _ImportIndex | None:
+    """Collect a Python file's imports from its syntax tree.
+
+    Handles parenthesized multi-line imports and aliases that the regex
+    scan can't follow. Returns None if the file doesn't parse.
+    """
+    if "import" not in content:
+        return _NO_IMPORTS
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+
+    modules: set[str] = set()
+    python_symbols: dict[str, set[str]] = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                _add_python_module(modules, alias.name.lower())
+        elif isinstance(node, ast.ImportFrom):
+            module = (node.module or "").lower()
+            if module:
+                _add_python_module(modules, module)
+            symbols = python_symbols.setdefault(module, set())
+            for alias in node.names:
+                symbols.add(alias.name.lower())
+                if alias.asname:
+                    symbols.add(alias.asname.lower())
+                # "from app import api" and "from . import utils" may import
+                # the named submodule itself
+                modules.add(alias.name.lower())
+
+    return _ImportIndex(
+        modules=frozenset(modules),
+        python_symbols={m: frozenset(s) for m, s in python_symbols.items()},
+        es_symbols=frozenset(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _file_imports(path_str: str, mtime_ns: int, size: int) -> _ImportIndex:
+    """Scan a file's imports once per (mtime, size) version."""
+    content = _read_file(path_str, size).decode()
+    if path_str.endswith(".py"):
+        imports = _scan_python_imports(content)
+        if imports is not None:
+            return imports
+    return _scan_imports(content)
+
+
 # @trace SPEC-05.30, SPEC-05.31
 def check_link(
     from_artifact: Path,
@@ -303,7 +585,8 @@ def check_link(
         search_root: Root directory for relative path resolution
         expected_symbol: Specific symbol to look for (optional)
     """
-    if not to_artifact.exists():
+    key = _stat_key(to_artifact)
+    if key is None:
         return LinkResult(
             from_path=from_artifact,
             to_path=to_artifact,
@@ -312,33 +595,26 @@ def check_link(
             details="Target file does not exist",
         )
 
-    content = to_artifact.read_text()
-
     # Get the module/component name from the source
     source_name = from_artifact.stem
 
     if link_type == "import":
+        # Several links usually point at the same importer, e.g. an App file
+        imports = _file_imports(*key)
+        module = source_name.lower()
+
         # If expected_symbol is provided, we need to verify that specific symbol is imported
         if expected_symbol:
-            # Check if the specific symbol appears in an import statement
-            symbol_import_patterns = [
-                # Python: from X import symbol or from X import a, symbol, b
-                rf"from\s+{source_name}\s+import\s+[^#\n]*\b{expected_symbol}\b",
-                # JS/TS: import { symbol } from or import { a, symbol } from
-                rf"import\s+\{{[^}}]*\b{expected_symbol}\b[^}}]*\}}\s+from",
-                # Default import: import symbol from
-                rf"import\s+{expected_symbol}\s+from",
-            ]
-
-            for pattern in symbol_import_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    return LinkResult(
-                        from_path=from_artifact,
-                        to_path=to_artifact,
-                        link_type=link_type,
-                        is_connected=True,
-                        details=f"Found import of {expected_symbol}",
-                    )
+            # Python: from X import symbol; JS/TS: import { symbol } / import symbol from
+            symbol = expected_symbol.lower()
+            if symbol in imports.python_symbols.get(module, ()) or symbol in imports.es_symbols:
+                return LinkResult(
+                    from_path=from_artifact,
+                    to_path=to_artifact,
+                    link_type=link_type,
+                    is_connected=True,
+                    details=f"Found import of {expected_symbol}",
+                )
 
             return LinkResult(
                 from_path=from_artifact,
@@ -349,26 +625,14 @@ def check_link(
             )
 
         # No specific symbol - just check if module is imported at all
-        import_patterns = [
-            # Python: from X import Y or import X
-            rf"from\s+['\"]?\.?/?{source_name}['\"]?\s+import",
-            rf"import\s+['\"]?\.?/?{source_name}['\"]?",
-            # JS/TS: import { X } from './Y' or import X from './Y'
-            rf"import\s+.*from\s+['\"]\.?/?{source_name}['\"]",
-            rf"import\s+{source_name}\s+from",
-            # require
-            rf"require\s*\(\s*['\"]\.?/?{source_name}['\"]",
-        ]
-
-        for pattern in import_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return LinkResult(
-                    from_path=from_artifact,
-                    to_path=to_artifact,
-                    link_type=link_type,
-                    is_connected=True,
-                    details=f"Found import of {source_name}",
-                )
+        if module in imports.modules:
+            return LinkResult(
+                from_path=from_artifact,
+                to_path=to_artifact,
+                link_type=link_type,
+                is_connected=True,
+                details=f"Found import of {source_name}",
+            )
 
     return LinkResult(
         from_path=from_artifact,
@@ -400,6 +664,10 @@ def verify_task(
     description = task.get("description", "")
     errors: list[str] = []
 
+    # No description means no criteria to verify - consider incomplete
+    if not description:
+        return VerificationResult(task_id=task_id, status=VerificationStatus.INCOMPLETE)
+
     # Extract truths from description
     truth_strings = extract_truths_from_description(description)
     truths: list[TruthResult] = []
@@ -410,31 +678,32 @@ def verify_task(
         truths.append(TruthResult(description=truth_str, status="?"))
 
     # Extract artifacts from description (bullet list format)
-    artifact_results: list[ArtifactResult] = []
-    artifact_paths: set[str] = set()
-
-    artifact_pattern = re.compile(r"Artifacts?:\s*\n((?:\s*[-*]\s*.+\n?)+)", re.IGNORECASE)
-    artifact_match = artifact_pattern.search(description)
-
-    if artifact_match:
-        bullets = artifact_match.group(1)
-        for line in bullets.split("\n"):
-            line = line.strip()
-            if line.startswith(("-", "*")):
-                artifact_path = line.lstrip("-* ").strip()
-                if artifact_path:
-                    artifact_paths.add(artifact_path)
+    artifact_paths = _bullets_under(description.splitlines(), _ARTIFACTS_HEADINGS)
 
     # Extract artifacts from @must_have annotations
     # @trace SPEC-05.87
-    must_have_artifacts = extract_must_have_artifacts(description)
-    artifact_paths.update(must_have_artifacts)
+    artifact_paths.extend(extract_must_have_artifacts(description))
+
+    # Nothing to check - skip the artifact and status passes entirely
+    if not truth_strings and not artifact_paths:
+        return VerificationResult(task_id=task_id, status=VerificationStatus.INCOMPLETE)
+
+    # Normalize before touching the filesystem so "src/a.py" and "./src/a.py"
+    # are checked once; dict keys keep the order the artifacts were listed in
+    full_paths = list(
+        dict.fromkeys(
+            Path(os.path.normpath(project_root / artifact_path))
+            for artifact_path in artifact_paths
+        )
+    )
 
-    # Check all artifacts
-    for artifact_path in artifact_paths:
-        full_path = project_root / artifact_path
-        result = check_artifact_substance(full_path)
-        artifact_results.append(result)
+    # Check all artifacts; each check is a stat plus a read, so larger sets
+    # are spread over threads while small ones skip the pool overhead
+    if len(full_paths) >= _PARALLEL_ARTIFACT_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(32, len(full_paths))) as executor:
+            artifact_results = list(executor.map(check_artifact_substance, full_paths))
+    else:
+        artifact_results = [check_artifact_substance(path) for path in full_paths]
 
     # Determine overall status
     # @trace SPEC-05.60
@@ -458,10 +727,10 @@ def verify_task(
     return VerificationResult(
         task_id=task_id,
         status=status,
-        truths=truths,
-        artifacts=artifact_results,
-        links=[],  # Links would be extracted from must_have key_links
-        errors=errors,
+        truths=tuple(truths),
+        artifacts=tuple(artifact_results),
+        links=(),  # Links would be extracted from must_have key_links
+        errors=tuple(errors),
     )
 
 
@@ -15,6 +15,7 @@ import subprocess
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +23,9 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent))
 from lib import builtin_provider
 
+# Bracketed spec references in issue titles and descriptions
+SPEC_REF_PATTERN = re.compile(r"\[SPEC-(\d+)\.(\d+)\]", re.ASCII)
+
 
 @dataclass
 class IssueMapping:
@@ -53,7 +57,8 @@ def parse_beads_issues(beads_dir: Path) -> list[dict[str, Any]]:
         raise FileNotFoundError(f"Beads issues file not found: {issues_file}")
 
     issues = []
-    with open(issues_file) as f:
+    # Stream raw lines; json.loads detects the UTF-8 encoding of each one
+    with open(issues_file, "rb") as f:
         for line in f:
             line = line.strip()
             if line:
@@ -64,23 +69,33 @@ def parse_beads_issues(beads_dir: Path) -> list[dict[str, Any]]:
 
 def extract_spec_refs(text: str) -> list[str]:
     """Extract SPEC-XX.YY references from text."""
-    pattern = r"\[SPEC-(\d+)\.(\d+)\]"
-    matches = re.findall(pattern, text or "")
-    return [f"SPEC-{m[0]}.{m[1]}" for m in matches]
+    # Most descriptions cite no specs; a substring test skips the regex and cache
+    if not text or "[SPEC-" not in text:
+        return []
+    # Fresh list per call so callers can't mutate the cached result
+    return list(_spec_refs(text))
+
+
+@lru_cache(maxsize=2048)
+def _spec_refs(text: str) -> tuple[str, ...]:
+    """Return the SPEC-XX.YY references in text, cached per distinct text."""
+    return tuple(f"SPEC-{m[0]}.{m[1]}" for m in SPEC_REF_PATTERN.findall(text))
+
+
+# Beads: 0=critical, 1=high, 2=medium, 3=low, 4=backlog
+# Chainlink: critical, high, medium, low
+BEADS_TO_CHAINLINK_PRIORITY = {0: "critical", 1: "high", 2: "medium", 3: "low", 4: "low"}
+CHAINLINK_TO_BEADS_PRIORITY = {"critical": 0, "high": 1, "medium": 2, "low": 3}
 
 
 def map_beads_priority(priority: int) -> str:
     """Map Beads numeric priority to Chainlink priority."""
-    # Beads: 0=critical, 1=high, 2=medium, 3=low, 4=backlog
-    # Chainlink: critical, high, medium, low
-    mapping = {0: "critical", 1: "high", 2: "medium", 3: "low", 4: "low"}
-    return mapping.get(priority, "medium")
+    return BEADS_TO_CHAINLINK_PRIORITY.get(priority, "medium")
 
 
 def map_chainlink_priority(priority: str) -> int:
     """Map Chainlink priority to Beads numeric priority."""
-    mapping = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    return mapping.get(priority.lower(), 2)
+    return CHAINLINK_TO_BEADS_PRIORITY.get(priority.lower(), 2)
 
 
 def create_chainlink_issue(
@@ -388,6 +403,7 @@ TYPE_PREFIX = {"bug": "[bug]", "feature": "[feature]", "task": "[task]",
                "epic": "[epic]", "chore": "[chore]"}
 TYPE_MAP = {"[bug]": "bug", "[feature]": "feature", "[task]": "task",
             "[epic]": "epic", "[chore]": "chore"}
+SUBJECT_METADATA_PATTERN = re.compile(r"^(\[P[0-4]\])?\s*(\[\w+\])?\s*(.+)$")
 
 
 def embed_metadata_in_subject(
@@ -404,10 +420,10 @@ def embed_metadata_in_subject(
     return title
 
 
+@lru_cache(maxsize=2048)
 def extract_metadata_from_subject(subject: str) -> tuple[str, int, str]:
     """Extract metadata from prefixed subject: [P1] [bug] Title -> (Title, 1, bug)."""
-    pattern = r'^(\[P[0-4]\])?\s*(\[\w+\])?\s*(.+)$'
-    match = re.match(pattern, subject)
+    match = SUBJECT_METADATA_PATTERN.match(subject)
     if match:
         priority_str, type_str, title = match.groups()
         priority = PRIORITY_MAP.get(priority_str, 2) if priority_str else 2
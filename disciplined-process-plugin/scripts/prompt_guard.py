@@ -22,6 +22,29 @@ sys.path.insert(0, str(Path(__file__).parent / "lib"))
 from lib.config import DPConfig, EnforcementLevel, get_config
 from lib.providers import feedback, get_project_dir
 
+# Spec references in prompts, with or without brackets, any case
+SPEC_REF_PATTERN = re.compile(r"\[?(SPEC-\d+\.\d+)\]?", re.IGNORECASE)
+
+# Language keyword patterns, compiled once. Keywords use word boundaries; extensions
+# like .py need (?<!\w) instead of \b at start (no word char before the dot)
+LANGUAGE_PATTERNS: dict[str, re.Pattern[str]] = {
+    "python": re.compile(
+        r"(?:\bpython\b|\bpytest\b|\bpip\b|\bdjango\b|\bflask\b|(?<!\w)\.py\b)",
+        re.IGNORECASE,
+    ),
+    "typescript": re.compile(
+        r"(?:\btypescript\b|\bnpm\b|\byarn\b|\breact\b|\bnext\b|(?<!\w)\.tsx?\b)",
+        re.IGNORECASE,
+    ),
+    "javascript": re.compile(
+        r"(?:\bjavascript\b|\bnode\b|(?<!\w)\.jsx?\b)", re.IGNORECASE
+    ),
+    "rust": re.compile(r"(?:\brust\b|\bcargo\b|\brustc\b|(?<!\w)\.rs\b)", re.IGNORECASE),
+    "go": re.compile(
+        r"(?:\bgolang\b|\bgo\s+build\b|\bgo\s+run\b|(?<!\w)\.go\b)", re.IGNORECASE
+    ),
+}
+
 
 def get_prompt_from_stdin() -> str:
     """Read the user prompt from stdin (passed by Claude Code)."""
@@ -32,9 +55,7 @@ def get_prompt_from_stdin() -> str:
 
 def extract_spec_references(text: str) -> list[str]:
     """Extract SPEC-XX.YY references from text."""
-    pattern = r"\[?SPEC-(\d+)\.(\d+)\]?"
-    matches = re.findall(pattern, text, re.IGNORECASE)
-    return [f"SPEC-{m[0]}.{m[1]}" for m in matches]
+    return [m.group(1).upper() for m in SPEC_REF_PATTERN.finditer(text)]
 
 
 def validate_spec_exists(spec_id: str, project_dir: Path) -> bool:
@@ -57,23 +78,7 @@ def validate_spec_exists(spec_id: str, project_dir: Path) -> bool:
 
 def detect_language_from_prompt(prompt: str) -> list[str]:
     """Detect programming languages mentioned in the prompt."""
-    languages = []
-
-    # Patterns use word boundaries for keywords but special handling for extensions
-    # Extensions like .py need (?<!\w) instead of \b at start (no word char before dot)
-    lang_patterns = {
-        "python": r"(?:\bpython\b|\bpytest\b|\bpip\b|\bdjango\b|\bflask\b|(?<!\w)\.py\b)",
-        "typescript": r"(?:\btypescript\b|\bnpm\b|\byarn\b|\breact\b|\bnext\b|(?<!\w)\.tsx?\b)",
-        "javascript": r"(?:\bjavascript\b|\bnode\b|(?<!\w)\.jsx?\b)",
-        "rust": r"(?:\brust\b|\bcargo\b|\brustc\b|(?<!\w)\.rs\b)",
-        "go": r"(?:\bgolang\b|\bgo\s+build\b|\bgo\s+run\b|(?<!\w)\.go\b)",
-    }
-
-    for lang, pattern in lang_patterns.items():
-        if re.search(pattern, prompt, re.IGNORECASE):
-            languages.append(lang)
-
-    return languages
+    return [lang for lang, pattern in LANGUAGE_PATTERNS.items() if pattern.search(prompt)]
 
 
 def get_language_rules(languages: list[str], project_dir: Path) -> str:
@@ -11,14 +11,20 @@ Provides functions to:
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
 import subprocess
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True)
 class SpecReference:
     """A specification reference with optional issue link."""
 
@@ -37,6 +43,7 @@ class TraceMarker:
     file_path: Path
     line_number: int
     context: str  # surrounding code/comment
+    rel_path: str = ""  # file path relative to the scan root, e.g. "src/auth.py"
 
 
 @dataclass
@@ -51,20 +58,55 @@ class TraceCoverage:
     test_locations: list[str] = field(default_factory=list)
 
 
-# Regex patterns
-SPEC_ID_PATTERN = re.compile(r"\[SPEC-(\d+)(?:\.(\d+))?\]")
-ISSUE_LINK_PATTERN = re.compile(r"<!--\s*(chainlink|beads):(\S+)\s*-->")
-TRACE_PATTERN = re.compile(r"@trace\s+SPEC-(\d+)\.(\d+)(?:\.(\w+))?")
+# Regex patterns; spec IDs are ASCII, so skip Unicode class matching
+SPEC_ID_PATTERN = re.compile(r"\[SPEC-(\d+)(?:\.(\d+))?\]", re.ASCII)
+ISSUE_LINK_PATTERN = re.compile(r"<!--\s*(chainlink|beads):(\S+)\s*-->", re.ASCII)
+TRACE_PATTERN = re.compile(r"@trace\s+SPEC-(\d+)\.(\d+)(?:\.(\w+))?", re.ASCII)
+SPEC_SECTION_PATTERN = re.compile(r"SPEC-(\d+)", re.ASCII)
+
+# TRACE_PATTERN over raw file bytes; the gap may not cross a line break
+_TRACE_BYTES_PATTERN = re.compile(
+    rb"@trace[^\S\n]+SPEC-(\d+)\.(\d+)(?:\.(\w+))?", re.ASCII
+)
+
+# Issue status keywords in `chainlink show` / `bd show` output
+_ISSUE_STATUS_PATTERN = re.compile(rb"(?i)\b(closed|in[ _]progress)\b")
+
+# Coverage report row: spec ID, indicator, issue info, test info, code info
+_ROW_FMT = "{:12} {} {:30} {:15} {}".format
+
+# File count from which find_trace_markers scans files on a thread pool
+_PARALLEL_SCAN_THRESHOLD = 16
+
+# Directories never scanned for trace markers (VCS metadata, vendored deps, build output)
+_EXCLUDE_DIRS = frozenset(
+    {
+        ".git",
+        "node_modules",
+        "__pycache__",
+        "target",
+        "dist",
+        "build",
+        "venv",
+        ".venv",
+        ".tox",
+    }
+)
 
 
 def parse_specs_from_file(file_path: Path) -> list[SpecReference]:
     """Parse all spec references from a markdown file."""
-    specs = []
+    specs: list[SpecReference] = []
     try:
         content = file_path.read_text()
+        # Cheap literal check before running the regex over every line
+        if "[SPEC-" not in content:
+            return specs
         lines = content.split("\n")
 
         for line_num, line in enumerate(lines, 1):
+            if "[SPEC-" not in line:
+                continue
             # Find spec IDs
             for match in SPEC_ID_PATTERN.finditer(line):
                 section = match.group(1)
@@ -103,57 +145,120 @@ def parse_specs_from_file(file_path: Path) -> list[SpecReference]:
 
 def parse_all_specs(spec_dir: Path) -> list[SpecReference]:
     """Parse all specs from the spec directory."""
-    all_specs = []
+    all_specs: list[SpecReference] = []
     if not spec_dir.is_dir():
         return all_specs
 
     for md_file in spec_dir.glob("**/*.md"):
-        all_specs.extend(parse_specs_from_file(md_file))
+        try:
+            st = md_file.stat()
+        except OSError:
+            continue
+        all_specs.extend(_parse_spec_file(str(md_file), st.st_mtime_ns, st.st_size))
 
     return sorted(all_specs, key=lambda s: s.spec_id)
 
 
+@lru_cache(maxsize=1024)
+def _parse_spec_file(
+    path_str: str, mtime_ns: int, size: int
+) -> tuple[SpecReference, ...]:
+    """Parse one spec file, cached on its path, mtime and size.
+
+    Coverage, link and unlink commands each re-read the whole spec tree; only
+    files edited since the last call (e.g. by link_spec_to_issue) are
+    reparsed. SpecReference is frozen, so sharing the cached records between
+    callers is safe.
+    """
+    return tuple(parse_specs_from_file(Path(path_str)))
+
+
+def _iter_source_files(search_dir: Path, patterns: list[str]) -> Iterator[Path]:
+    """Yield files under search_dir matching any pattern, skipping _EXCLUDE_DIRS."""
+    stack = [str(search_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _EXCLUDE_DIRS:
+                            stack.append(entry.path)
+                    elif any(fnmatch.fnmatch(entry.name, p) for p in patterns):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _scan_file(file_path: Path, root: Path | None) -> list[TraceMarker]:
+    """Return the @trace markers in one file, or none if it can't be read."""
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return []
+
+    # Most source files have no markers; skip them without a regex pass
+    if b"@trace" not in data:
+        return []
+
+    markers = []
+    rel_path = str(file_path.relative_to(root) if root else file_path)
+    line_num, counted_to = 1, 0
+    for match in _TRACE_BYTES_PATTERN.finditer(data):
+        start = match.start()
+        line_num += data.count(b"\n", counted_to, start)
+        counted_to = start
+
+        spec_id = f"SPEC-{match.group(1).decode()}.{match.group(2).decode()}"
+        if match.group(3):
+            spec_id += f".{match.group(3).decode()}"
+
+        # Only the matched line is decoded, for the marker's context
+        line_start = data.rfind(b"\n", 0, start) + 1
+        line_end = data.find(b"\n", start)
+        line = data[line_start : line_end if line_end != -1 else len(data)]
+
+        markers.append(
+            TraceMarker(
+                spec_id=spec_id,
+                file_path=file_path,
+                line_number=line_num,
+                context=line.decode(errors="replace").strip(),
+                rel_path=rel_path,
+            )
+        )
+    return markers
+
+
 def find_trace_markers(
-    search_dirs: list[Path], patterns: list[str] | None = None
+    search_dirs: list[Path],
+    patterns: list[str] | None = None,
+    root: Path | None = None,
 ) -> list[TraceMarker]:
-    """Find all @trace markers in code and test files."""
-    markers = []
+    """Find all @trace markers in code and test files.
 
+    If ``root`` is given, each marker's ``rel_path`` is computed relative to it
+    (once per file); otherwise ``rel_path`` is the file path as found.
+    """
     if patterns is None:
         patterns = ["*.py", "*.ts", "*.tsx", "*.js", "*.go", "*.rs"]
 
-    for search_dir in search_dirs:
-        if not search_dir.is_dir():
-            continue
+    files = [
+        file_path
+        for search_dir in search_dirs
+        if search_dir.is_dir()
+        for file_path in _iter_source_files(search_dir, patterns)
+    ]
 
-        for pattern in patterns:
-            for file_path in search_dir.glob(f"**/{pattern}"):
-                try:
-                    content = file_path.read_text()
-                    lines = content.split("\n")
-
-                    for line_num, line in enumerate(lines, 1):
-                        for match in TRACE_PATTERN.finditer(line):
-                            section = match.group(1)
-                            paragraph = match.group(2)
-                            sub = match.group(3)
-
-                            spec_id = f"SPEC-{section}.{paragraph}"
-                            if sub:
-                                spec_id += f".{sub}"
-
-                            markers.append(
-                                TraceMarker(
-                                    spec_id=spec_id,
-                                    file_path=file_path,
-                                    line_number=line_num,
-                                    context=line.strip(),
-                                )
-                            )
-                except (OSError, UnicodeDecodeError):
-                    continue
+    # Scanning is dominated by file reads, so larger trees are spread over
+    # threads while small ones skip the pool overhead; map keeps file order
+    if len(files) >= _PARALLEL_SCAN_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=min(16, len(files))) as executor:
+            per_file = list(executor.map(lambda f: _scan_file(f, root), files))
+    else:
+        per_file = [_scan_file(f, root) for f in files]
 
-    return markers
+    return [marker for markers in per_file for marker in markers]
 
 
 def get_issue_status(issue_link: str, project_dir: Path) -> str | None:
@@ -167,45 +272,53 @@ def get_issue_status(issue_link: str, project_dir: Path) -> str | None:
 
     provider, issue_id = parts
 
+    commands = {
+        "chainlink": ["chainlink", "show", issue_id],
+        "beads": ["bd", "show", issue_id],
+    }
+    if provider not in commands:
+        return None
+
     try:
-        if provider == "chainlink":
-            result = subprocess.run(
-                ["chainlink", "show", issue_id],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=project_dir,
-            )
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                if "closed" in output:
-                    return "closed"
-                elif "in progress" in output or "in_progress" in output:
-                    return "in_progress"
-                else:
-                    return "open"
-        elif provider == "beads":
-            result = subprocess.run(
-                ["bd", "show", issue_id],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                cwd=project_dir,
-            )
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                if "closed" in output:
-                    return "closed"
-                elif "in_progress" in output:
-                    return "in_progress"
-                else:
-                    return "open"
+        # Raw bytes output: one regex pass, no lowercased copy of the buffer
+        result = subprocess.run(
+            commands[provider],
+            capture_output=True,
+            timeout=10,
+            cwd=project_dir,
+        )
+        if result.returncode == 0:
+            found = {m.lower() for m in _ISSUE_STATUS_PATTERN.findall(result.stdout)}
+            if b"closed" in found:
+                return "closed"
+            elif found:
+                return "in_progress"
+            else:
+                return "open"
     except (subprocess.TimeoutExpired, OSError):
         pass
 
     return None
 
 
+def _prefix_lookup(markers: list[TraceMarker]) -> Callable[[str], list[TraceMarker]]:
+    """Index markers by spec ID for repeated prefix queries.
+
+    The returned function lists, in scan order, the markers whose spec ID
+    starts with the given prefix: two binary searches over the sorted IDs
+    instead of a pass over every marker per spec.
+    """
+    ordered = sorted(range(len(markers)), key=lambda i: markers[i].spec_id)
+    keys = [markers[i].spec_id for i in ordered]
+
+    def lookup(prefix: str) -> list[TraceMarker]:
+        lo = bisect_left(keys, prefix)
+        hi = bisect_left(keys, prefix + "\U0010ffff", lo)
+        return [markers[i] for i in sorted(ordered[lo:hi])]
+
+    return lookup
+
+
 def generate_coverage_report(project_dir: Path) -> list[TraceCoverage]:
     """Generate full traceability coverage report."""
     spec_dir = project_dir / "docs" / "spec"
@@ -216,44 +329,63 @@ def generate_coverage_report(project_dir: Path) -> list[TraceCoverage]:
     specs = parse_all_specs(spec_dir)
 
     # Find all trace markers
-    code_markers = find_trace_markers([src_dir])
-    test_markers = find_trace_markers([tests_dir])
+    code_markers = find_trace_markers([src_dir], root=project_dir)
+    test_markers = find_trace_markers([tests_dir], root=project_dir)
+
+    # Look up issue statuses concurrently; each lookup is a CLI subprocess
+    issue_links = list(dict.fromkeys(s.issue_link for s in specs if s.issue_link))
+    issue_statuses: dict[str, str | None] = {}
+    if issue_links:
+        with ThreadPoolExecutor(max_workers=min(16, len(issue_links))) as executor:
+            issue_statuses = dict(
+                zip(
+                    issue_links,
+                    executor.map(
+                        lambda link: get_issue_status(link, project_dir), issue_links
+                    ),
+                    strict=True,
+                )
+            )
 
     # Build coverage info
+    code_traces_for = _prefix_lookup(code_markers)
+    test_traces_for = _prefix_lookup(test_markers)
     coverage = []
     for spec in specs:
         # Find matching traces (match SPEC-XX.YY, ignoring sub-items like .a)
-        base_spec_id = spec.spec_id
-        code_traces = [
-            m for m in code_markers if m.spec_id.startswith(base_spec_id)
-        ]
-        test_traces = [
-            m for m in test_markers if m.spec_id.startswith(base_spec_id)
-        ]
-
-        # Get issue status
-        issue_status = get_issue_status(spec.issue_link, project_dir)
+        code_traces = code_traces_for(spec.spec_id)
+        test_traces = test_traces_for(spec.spec_id)
 
         coverage.append(
             TraceCoverage(
                 spec=spec,
-                issue_status=issue_status,
+                issue_status=issue_statuses.get(spec.issue_link or ""),
                 trace_count=len(code_traces) + len(test_traces),
                 test_count=len(test_traces),
-                code_locations=[
-                    f"{m.file_path.relative_to(project_dir)}:{m.line_number}"
-                    for m in code_traces
-                ],
-                test_locations=[
-                    f"{m.file_path.relative_to(project_dir)}:{m.line_number}"
-                    for m in test_traces
-                ],
+                code_locations=[f"{m.rel_path}:{m.line_number}" for m in code_traces],
+                test_locations=[f"{m.rel_path}:{m.line_number}" for m in test_traces],
             )
         )
 
     return coverage
 
 
+def _rewrite_spec_line(spec: SpecReference, transform: Callable[[str], str]) -> None:
+    """Rewrite the spec's line in place by splicing around its newline offsets."""
+    content = spec.file_path.read_text()
+
+    # Locate the newline preceding the spec's line (-1 for the first line)
+    line_start = -1
+    for _ in range(spec.line_number - 1):
+        line_start = content.find("\n", line_start + 1)
+    line_end = content.find("\n", line_start + 1)
+    if line_end == -1:
+        line_end = len(content)
+
+    new_line = transform(content[line_start + 1 : line_end])
+    spec.file_path.write_text(content[: line_start + 1] + new_line + content[line_end:])
+
+
 def link_spec_to_issue(
     spec_id: str, issue_id: str, provider: str, project_dir: Path
 ) -> bool:
@@ -266,23 +398,12 @@ def link_spec_to_issue(
     if not spec:
         return False
 
-    # Read file
-    content = spec.file_path.read_text()
-    lines = content.split("\n")
-
-    # Find and update the line
-    line_idx = spec.line_number - 1
-    line = lines[line_idx]
-
-    # Remove existing link if present
-    line = ISSUE_LINK_PATTERN.sub("", line).rstrip()
-
-    # Add new link
-    line = f"{line} <!-- {provider}:{issue_id} -->"
-    lines[line_idx] = line
-
-    # Write back
-    spec.file_path.write_text("\n".join(lines))
+    # Replace existing link (if any) with the new one
+    _rewrite_spec_line(
+        spec,
+        lambda line: f"{ISSUE_LINK_PATTERN.sub('', line).rstrip()} "
+        f"<!-- {provider}:{issue_id} -->",
+    )
     return True
 
 
@@ -296,20 +417,8 @@ def unlink_spec(spec_id: str, project_dir: Path) -> bool:
     if not spec or not spec.issue_link:
         return False
 
-    # Read file
-    content = spec.file_path.read_text()
-    lines = content.split("\n")
-
-    # Find and update the line
-    line_idx = spec.line_number - 1
-    line = lines[line_idx]
-
     # Remove link
-    line = ISSUE_LINK_PATTERN.sub("", line).rstrip()
-    lines[line_idx] = line
-
-    # Write back
-    spec.file_path.write_text("\n".join(lines))
+    _rewrite_spec_line(spec, lambda line: ISSUE_LINK_PATTERN.sub("", line).rstrip())
     return True
 
 
@@ -322,15 +431,12 @@ def format_coverage_report(coverage: list[TraceCoverage], project_dir: Path) ->
     ]
 
     # Group by section
-    sections: dict[str, list[TraceCoverage]] = {}
+    sections: dict[str, list[TraceCoverage]] = defaultdict(list)
     for cov in coverage:
         # Extract section from SPEC-XX.YY
-        match = re.match(r"SPEC-(\d+)", cov.spec.spec_id)
+        match = SPEC_SECTION_PATTERN.match(cov.spec.spec_id)
         if match:
-            section = match.group(1)
-            if section not in sections:
-                sections[section] = []
-            sections[section].append(cov)
+            sections[match.group(1)].append(cov)
 
     # Output each section
     total_specs = 0
@@ -372,7 +478,7 @@ def format_coverage_report(coverage: list[TraceCoverage], project_dir: Path) ->
                 code_info = "code: -"
 
             lines.append(
-                f"{cov.spec.spec_id:12} {indicator} {issue_info:30} {test_info:15} {code_info}"
+                _ROW_FMT(cov.spec.spec_id, indicator, issue_info, test_info, code_info)
             )
 
         lines.append("")
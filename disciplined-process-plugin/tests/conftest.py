@@ -4,34 +4,166 @@ Pytest configuration and shared fixtures for disciplined-process-plugin tests.
 
 from __future__ import annotations
 
+import importlib
 import json
 import os
+import shutil
 import sys
-import tempfile
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any
 
 import pytest
-
-# Add scripts directory to path for imports
-SCRIPTS_DIR = Path(__file__).parent.parent / "scripts"
-sys.path.insert(0, str(SCRIPTS_DIR))
+import yaml
+from hypothesis import settings
+
+# Add scripts directory to path for imports; test modules rely on this
+# rather than patching sys.path themselves
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Project directory reported to hooks under test
+CWD = Path(".")
+
+# RAM-backed directory that DP_TESTS_ON_TMPFS=1 roots --basetemp under
+TMPFS_ROOT = Path("/dev/shm")
+
+# Hypothesis budget: "fast" by default, HYPOTHESIS_PROFILE=ci for the full search
+settings.register_profile(
+    "fast", max_examples=25, deadline=None, database=None, derandomize=True
+)
+settings.register_profile("ci", deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "fast"))
+
+# Script modules some tests import lazily inside test bodies
+PRELOAD_MODULES = (
+    "init_wizard",
+    "migrate",
+    "traceability",
+    "lib.builtin_provider",
+    "lib.config",
+    "lib.degradation",
+    "lib.plan_validation",
+    "lib.providers",
+    "lib.verification",
+)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the --no-hypothesis fast-loop switch."""
+    parser.addoption(
+        "--no-hypothesis",
+        action="store_true",
+        default=False,
+        help="Skip Hypothesis property-based tests",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Opt in to a RAM-backed --basetemp with DP_TESTS_ON_TMPFS=1.
+
+    Only applies when --basetemp was not given and /dev/shm exists. pytest
+    clears the directory at the start of each run, and xdist workers get
+    their own subdirectories; the tempfile module is left alone.
+    """
+    if (
+        os.environ.get("DP_TESTS_ON_TMPFS") == "1"
+        and config.option.basetemp is None
+        and TMPFS_ROOT.is_dir()
+    ):
+        config.option.basetemp = str(TMPFS_ROOT / f"pytest-dpp-{os.getuid()}")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip property-based tests when --no-hypothesis is given."""
+    if not config.getoption("--no-hypothesis"):
+        return
+    skip = pytest.mark.skip(reason="--no-hypothesis given")
+    for item in items:
+        if hasattr(getattr(item, "obj", None), "hypothesis"):
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _preload_modules() -> None:
+    """Warm sys.modules once so no test pays a cold import."""
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
 
 
 @pytest.fixture
-def temp_project_dir() -> Generator[Path, None, None]:
+def temp_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a temporary project directory with basic structure."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        project = Path(tmpdir)
+    # A numbered dir under pytest's basetemp, cleaned up with the session's
+    # retention policy rather than an rmtree after every test
+    project = tmp_path_factory.mktemp("proj")
+
+    # Create basic structure
+    (project / "docs" / "spec").mkdir(parents=True)
+    (project / "docs" / "adr").mkdir(parents=True)
+    (project / "src").mkdir(parents=True)
+    (project / "tests").mkdir(parents=True)
+    (project / ".claude").mkdir(parents=True)
+
+    return project
+
+
+@pytest.fixture(scope="class")
+def shared_tmp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One empty directory reused by every Hypothesis example in a class.
+
+    Function-scoped tmp_path can't be used with @given, and a fresh mktemp per
+    example is wasted work; tests overwrite their own files in it.
+    """
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="session")
+def canonical_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one detectable project (package.json, TypeScript source, .claude/).
+
+    Shared across the session, so tests must treat it as read-only. Under
+    pytest-xdist each worker has its own basetemp and builds its own copy.
+    """
+    project = tmp_path_factory.mktemp("canonical") / "canonical-project"
+    (project / "src").mkdir(parents=True)
+    (project / ".claude").mkdir()
+    (project / "package.json").write_text('{"name": "canonical-project"}')
+    (project / "src" / "app.ts").write_text("export const x = 1;")
+    return project
 
-        # Create basic structure
-        (project / "docs" / "spec").mkdir(parents=True)
-        (project / "docs" / "adr").mkdir(parents=True)
-        (project / "src").mkdir(parents=True)
-        (project / "tests").mkdir(parents=True)
-        (project / ".claude").mkdir(parents=True)
 
-        yield project
+@pytest.fixture(scope="session")
+def beads_project(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build one project whose .beads/issues.jsonl holds a single bug.
+
+    Shared across the session, so tests must treat it as read-only (dry-run
+    migrations only).
+    """
+    project = tmp_path_factory.mktemp("beads")
+    beads_dir = project / ".beads"
+    beads_dir.mkdir()
+    (beads_dir / "issues.jsonl").write_text(
+        '{"id": "bd-001", "title": "Test Issue", "priority": 1, "issue_type": "bug"}\n'
+    )
+    return project
+
+
+@pytest.fixture
+def project(canonical_project: Path, tmp_path: Path) -> Path:
+    """Give a mutating test its own copy of the canonical project."""
+    return Path(shutil.copytree(canonical_project, tmp_path / canonical_project.name))
+
+
+@pytest.fixture
+def patched_project_dir(monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Make the prompt_guard and session_start hooks see CWD as the project dir."""
+    monkeypatch.setattr("prompt_guard.get_project_dir", lambda: CWD)
+    monkeypatch.setattr("scripts.session_start.get_project_dir", lambda: CWD)
+    return CWD
 
 
 @pytest.fixture
@@ -127,8 +259,8 @@ def config_dict() -> dict[str, Any]:
 @pytest.fixture
 def dp_config_file(temp_project_dir: Path, config_dict: dict[str, Any]) -> Path:
     """Create a dp-config.yaml file in the project."""
-    import yaml
-
     config_path = temp_project_dir / ".claude" / "dp-config.yaml"
-    config_path.write_text(yaml.dump(config_dict))
+    # Prefer the libyaml-backed dumper when available
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    config_path.write_text(yaml.dump(config_dict, Dumper=dumper))
     return config_path
@@ -9,14 +9,11 @@ Covers:
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 
 import pytest
 from hypothesis import given, settings, strategies as st
 
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from adversarial_review import (
     AdversaryResponse,
     Critique,
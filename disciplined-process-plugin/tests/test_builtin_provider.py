@@ -2,12 +2,12 @@
 
 import json
 import os
-import tempfile
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
+from scripts.lib import builtin_provider
 from scripts.lib.builtin_provider import (
     add_blocker,
     create_task,
@@ -19,6 +19,37 @@ from scripts.lib.builtin_provider import (
     update_task,
 )
 
+# Fixed task files, serialized once at import
+# Ready: pending, no blockers
+READY_TASK_JSON = json.dumps(
+    {"id": "1", "subject": "Ready", "status": "pending", "blockedBy": []}
+).encode()
+# Not ready: has blocker
+BLOCKED_TASK_JSON = json.dumps(
+    {"id": "2", "subject": "Blocked", "status": "pending", "blockedBy": ["1"]}
+).encode()
+# Not ready: not pending
+DONE_TASK_JSON = json.dumps(
+    {"id": "3", "subject": "Done", "status": "completed", "blockedBy": []}
+).encode()
+# Ready: pending, no blockedBy field
+READY_NO_BLOCKERS_FIELD_TASK_JSON = json.dumps(
+    {"id": "4", "subject": "Also Ready", "status": "pending"}
+).encode()
+
+
+@pytest.fixture
+def tasks_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the provider's tasks directory at a per-test temp directory."""
+    monkeypatch.setattr(builtin_provider, "get_tasks_dir", lambda _list_id: tmp_path)
+    return tmp_path
+
+
+def write_tasks(dir_path: Path, tasks: dict[str, dict]) -> None:
+    """Write each task as <name>.json in dir_path."""
+    for name, task in tasks.items():
+        (dir_path / f"{name}.json").write_text(json.dumps(task))
+
 
 class TestGetTaskListId:
     """Tests for get_task_list_id function."""
@@ -43,6 +74,17 @@ class TestGetTaskListId:
         result2 = get_task_list_id(project)
         assert result1 == result2
 
+    def test_get_task_list_id_is_memoized(self):
+        """Repeated lookups for the same project should hit the hash cache."""
+        builtin_provider._hash_project.cache_clear()
+        project = Path("/tmp/memo-project")
+
+        first = get_task_list_id(project)
+        second = get_task_list_id(project)
+
+        assert first == second
+        assert builtin_provider._hash_project.cache_info().hits >= 1
+
     def test_different_paths_generate_different_hashes(self):
         """Different project paths should produce different hashes."""
         project1 = Path("/tmp/project-one")
@@ -65,17 +107,15 @@ class TestGetTasksDir:
 class TestEnsureEnvSet:
     """Tests for ensure_env_set function."""
 
-    def test_sets_environment_variable(self):
+    def test_sets_environment_variable(self, monkeypatch: pytest.MonkeyPatch):
         """Should set CLAUDE_CODE_TASK_LIST_ID env var."""
-        # Clear any existing value
-        os.environ.pop("CLAUDE_CODE_TASK_LIST_ID", None)
+        # Start from a clean value; monkeypatch restores the original afterwards
+        monkeypatch.delenv("CLAUDE_CODE_TASK_LIST_ID", raising=False)
+        monkeypatch.setenv("CLAUDE_CODE_TASK_LIST_ID", "")
 
         ensure_env_set("my-task-list")
         assert os.environ.get("CLAUDE_CODE_TASK_LIST_ID") == "my-task-list"
 
-        # Clean up
-        os.environ.pop("CLAUDE_CODE_TASK_LIST_ID", None)
-
 
 class TestListTasks:
     """Tests for list_tasks function."""
@@ -85,192 +125,187 @@ class TestListTasks:
         result = list_tasks("nonexistent-list-12345")
         assert result == []
 
-    def test_lists_tasks_from_json_files(self, tmp_path):
+    def test_lists_tasks_from_json_files(self, tasks_dir):
         """Should read and return task data from JSON files."""
-        # Create mock tasks directory
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            # Create some task files
-            task1 = {"id": "1", "subject": "Task 1", "status": "pending"}
-            task2 = {"id": "2", "subject": "Task 2", "status": "completed"}
+        # Create some task files
+        task1 = {"id": "1", "subject": "Task 1", "status": "pending"}
+        task2 = {"id": "2", "subject": "Task 2", "status": "completed"}
 
-            (tmp_path / "1.json").write_text(json.dumps(task1))
-            (tmp_path / "2.json").write_text(json.dumps(task2))
+        write_tasks(tasks_dir, {"1": task1, "2": task2})
 
-            result = list_tasks("test-list")
-            assert len(result) == 2
-            subjects = {t["subject"] for t in result}
-            assert subjects == {"Task 1", "Task 2"}
+        result = list_tasks("test-list")
+        assert len(result) == 2
+        subjects = {t["subject"] for t in result}
+        assert subjects == {"Task 1", "Task 2"}
 
-    def test_ignores_hidden_files(self, tmp_path):
+    def test_ignores_hidden_files(self, tasks_dir):
         """Should skip files starting with dot."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            task1 = {"id": "1", "subject": "Visible"}
-            hidden = {"id": "h", "subject": "Hidden"}
+        task1 = {"id": "1", "subject": "Visible"}
+        hidden = {"id": "h", "subject": "Hidden"}
+
+        write_tasks(tasks_dir, {"1": task1, ".hidden": hidden})
+
+        result = list_tasks("test-list")
+        assert len(result) == 1
+        assert result[0]["subject"] == "Visible"
+
+    def test_skips_non_json_and_invalid_files(self, tasks_dir):
+        """Should ignore non-JSON files, directories, and unparsable tasks."""
+        write_tasks(tasks_dir, {"1": {"id": "1", "subject": "Valid"}})
+        (tasks_dir / "notes.txt").write_text("not a task")
+        (tasks_dir / "2.json").write_text("{not json")
+        (tasks_dir / "sub.json").mkdir()
+
+        result = list_tasks("test-list")
+        assert [t["subject"] for t in result] == ["Valid"]
+
+    def test_list_tasks_uses_scandir(self, tasks_dir):
+        """Should list the directory with a single os.scandir call."""
+        write_tasks(tasks_dir, {"1": {"id": "1"}, "2": {"id": "2"}})
+
+        with mock.patch.object(
+            builtin_provider.os, "scandir", wraps=os.scandir
+        ) as mock_scandir:
+            result = list_tasks("test-list")
 
-            (tmp_path / "1.json").write_text(json.dumps(task1))
-            (tmp_path / ".hidden.json").write_text(json.dumps(hidden))
+        assert len(result) == 2
+        mock_scandir.assert_called_once_with(tasks_dir)
 
+    @pytest.mark.parametrize("n", [10, 100, 1000])
+    def test_list_tasks_scales_linearly(self, tasks_dir, monkeypatch, n):
+        """Should do one directory scan plus exactly one open per task file."""
+        write_tasks(tasks_dir, {str(i): {"id": str(i)} for i in range(n)})
+
+        opened: list[str] = []
+
+        def counting_open(path, *args, **kwargs):
+            opened.append(path)
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtin_provider, "open", counting_open, raising=False)
+        with mock.patch.object(
+            builtin_provider.os, "scandir", wraps=os.scandir
+        ) as mock_scandir:
             result = list_tasks("test-list")
-            assert len(result) == 1
-            assert result[0]["subject"] == "Visible"
+
+        assert len(result) == n
+        assert mock_scandir.call_count == 1
+        assert len(opened) == n
 
 
 class TestGetReadyCount:
     """Tests for get_ready_count function."""
 
-    def test_counts_pending_tasks_without_blockers(self, tmp_path):
+    def test_counts_pending_tasks_without_blockers(self, tasks_dir):
         """Should count tasks that are pending with no blockedBy."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            # Ready: pending, no blockers
-            task1 = {"id": "1", "subject": "Ready", "status": "pending", "blockedBy": []}
-            # Not ready: has blocker
-            task2 = {
-                "id": "2",
-                "subject": "Blocked",
-                "status": "pending",
-                "blockedBy": ["1"],
-            }
-            # Not ready: not pending
-            task3 = {"id": "3", "subject": "Done", "status": "completed", "blockedBy": []}
-            # Ready: pending, no blockedBy field
-            task4 = {"id": "4", "subject": "Also Ready", "status": "pending"}
-
-            (tmp_path / "1.json").write_text(json.dumps(task1))
-            (tmp_path / "2.json").write_text(json.dumps(task2))
-            (tmp_path / "3.json").write_text(json.dumps(task3))
-            (tmp_path / "4.json").write_text(json.dumps(task4))
+        (tasks_dir / "1.json").write_bytes(READY_TASK_JSON)
+        (tasks_dir / "2.json").write_bytes(BLOCKED_TASK_JSON)
+        (tasks_dir / "3.json").write_bytes(DONE_TASK_JSON)
+        (tasks_dir / "4.json").write_bytes(READY_NO_BLOCKERS_FIELD_TASK_JSON)
 
-            result = get_ready_count("test-list")
-            assert result == 2
+        result = get_ready_count("test-list")
+        assert result == 2
 
 
 class TestCreateTask:
     """Tests for create_task function."""
 
-    def test_creates_task_with_defaults(self, tmp_path):
+    def test_creates_task_with_defaults(self, tasks_dir):
         """Should create task with default values."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            task = create_task("test-list", "My Task")
-
-            assert task["id"] == "1"
-            assert task["subject"] == "My Task"
-            assert task["description"] == ""
-            assert task["status"] == "pending"
-            assert task["blocks"] == []
-            assert task["blockedBy"] == []
-
-            # Verify file was created
-            task_file = tmp_path / "1.json"
-            assert task_file.exists()
-
-    def test_creates_task_with_description(self, tmp_path):
+        task = create_task("test-list", "My Task")
+
+        assert task["id"] == "1"
+        assert task["subject"] == "My Task"
+        assert task["description"] == ""
+        assert task["status"] == "pending"
+        assert task["blocks"] == []
+        assert task["blockedBy"] == []
+
+        # Verify file was created
+        task_file = tasks_dir / "1.json"
+        assert task_file.exists()
+
+    def test_creates_task_with_description(self, tasks_dir):
         """Should include description when provided."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            task = create_task("test-list", "My Task", description="Details here")
-            assert task["description"] == "Details here"
+        task = create_task("test-list", "My Task", description="Details here")
+        assert task["description"] == "Details here"
 
-    def test_creates_task_with_active_form(self, tmp_path):
+    def test_creates_task_with_active_form(self, tasks_dir):
         """Should include activeForm when provided."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            task = create_task(
-                "test-list", "Run tests", active_form="Running tests"
-            )
-            assert task["activeForm"] == "Running tests"
-
-    def test_increments_task_id(self, tmp_path):
+        task = create_task(
+            "test-list", "Run tests", active_form="Running tests"
+        )
+        assert task["activeForm"] == "Running tests"
+
+    def test_increments_task_id(self, tasks_dir):
         """Should increment ID based on existing tasks."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            task1 = create_task("test-list", "First")
-            task2 = create_task("test-list", "Second")
-            task3 = create_task("test-list", "Third")
+        task1 = create_task("test-list", "First")
+        task2 = create_task("test-list", "Second")
+        task3 = create_task("test-list", "Third")
 
-            assert task1["id"] == "1"
-            assert task2["id"] == "2"
-            assert task3["id"] == "3"
+        assert task1["id"] == "1"
+        assert task2["id"] == "2"
+        assert task3["id"] == "3"
 
 
 class TestUpdateTask:
     """Tests for update_task function."""
 
-    def test_updates_existing_task(self, tmp_path):
+    def test_updates_existing_task(self, tasks_dir):
         """Should update fields on existing task."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            # Create a task first
-            create_task("test-list", "Original")
+        # Create a task first
+        create_task("test-list", "Original")
 
-            # Update it
-            updated = update_task("test-list", "1", status="in_progress")
+        # Update it
+        updated = update_task("test-list", "1", status="in_progress")
 
-            assert updated["status"] == "in_progress"
-            assert updated["subject"] == "Original"
+        assert updated["status"] == "in_progress"
+        assert updated["subject"] == "Original"
 
-    def test_returns_none_for_nonexistent_task(self, tmp_path):
+    def test_returns_none_for_nonexistent_task(self, tasks_dir):
         """Should return None when task doesn't exist."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            result = update_task("test-list", "999", status="done")
-            assert result is None
+        result = update_task("test-list", "999", status="done")
+        assert result is None
 
-    def test_merges_blocker_lists(self, tmp_path):
+    def test_merges_blocker_lists(self, tasks_dir):
         """Should merge blockedBy lists instead of replacing."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            # Create task with existing blocker
-            task_data = {
-                "id": "1",
-                "subject": "Test",
-                "status": "pending",
-                "blockedBy": ["2"],
-                "blocks": [],
-            }
-            (tmp_path / "1.json").write_text(json.dumps(task_data))
+        # Create task with existing blocker
+        task_data = {
+            "id": "1",
+            "subject": "Test",
+            "status": "pending",
+            "blockedBy": ["2"],
+            "blocks": [],
+        }
+        write_tasks(tasks_dir, {"1": task_data})
 
-            # Add another blocker
-            updated = update_task("test-list", "1", blockedBy=["3"])
+        # Add another blocker
+        updated = update_task("test-list", "1", blockedBy=["3"])
 
-            assert set(updated["blockedBy"]) == {"2", "3"}
+        assert set(updated["blockedBy"]) == {"2", "3"}
 
 
 class TestAddBlocker:
     """Tests for add_blocker function."""
 
-    def test_adds_bidirectional_blocking(self, tmp_path):
+    def test_adds_bidirectional_blocking(self, tasks_dir):
         """Should update both tasks with blocking relationship."""
-        with mock.patch(
-            "scripts.lib.builtin_provider.get_tasks_dir", return_value=tmp_path
-        ):
-            # Create two tasks
-            create_task("test-list", "Task 1")
-            create_task("test-list", "Task 2")
-
-            # Task 2 is blocked by Task 1
-            result = add_blocker("test-list", "2", "1")
-            assert result is True
-
-            # Verify Task 2 has Task 1 in blockedBy
-            task2_file = tmp_path / "2.json"
-            task2 = json.loads(task2_file.read_text())
-            assert "1" in task2["blockedBy"]
-
-            # Verify Task 1 has Task 2 in blocks
-            task1_file = tmp_path / "1.json"
-            task1 = json.loads(task1_file.read_text())
-            assert "2" in task1["blocks"]
+        # Create two tasks
+        create_task("test-list", "Task 1")
+        create_task("test-list", "Task 2")
+
+        # Task 2 is blocked by Task 1
+        result = add_blocker("test-list", "2", "1")
+        assert result is True
+
+        # Read back both task files in one directory pass
+        with os.scandir(tasks_dir) as it:
+            entries = {
+                e.name: json.loads(Path(e.path).read_text())
+                for e in it
+                if e.is_file(follow_symlinks=False)
+            }
+
+        # Task 2 has Task 1 in blockedBy; Task 1 has Task 2 in blocks
+        assert "1" in entries["2.json"]["blockedBy"]
+        assert "2" in entries["1.json"]["blocks"]
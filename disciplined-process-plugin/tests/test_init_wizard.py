@@ -7,14 +7,28 @@ Tests for init_wizard.py initialization script.
 from __future__ import annotations
 
 import json
-import sys
+from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
-
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from init_wizard import (
+    WizardConfig,
+    _classify_extensions,
+    check_cli_available,
+    check_tracker_availability,
+    create_adr_template,
+    create_config_file,
+    create_language_rules,
+    create_settings_file,
+    create_spec_template,
+    detect_languages,
+    detect_project_name,
+    execute_setup,
+    run_wizard,
+)
+
+from lib.config import TaskTracker
 
 
 class TestWizardConfig:
@@ -22,9 +36,6 @@ class TestWizardConfig:
 
     def test_default_values(self):
         """Should have sensible defaults."""
-        from init_wizard import WizardConfig
-        from lib.config import TaskTracker
-
         config = WizardConfig()
         assert config.project_name == ""
         assert config.languages == []
@@ -34,9 +45,6 @@ class TestWizardConfig:
 
     def test_custom_values(self):
         """Should accept custom values."""
-        from init_wizard import WizardConfig
-        from lib.config import TaskTracker
-
         config = WizardConfig(
             project_name="my-project",
             languages=["python", "rust"],
@@ -52,40 +60,28 @@ class TestWizardConfig:
 class TestDetectProjectName:
     """Test project name detection."""
 
-    def test_from_package_json(self, tmp_path: Path):
-        """Should detect name from package.json."""
-        from init_wizard import detect_project_name
-
-        package = tmp_path / "package.json"
-        package.write_text('{"name": "my-node-project"}')
-
-        name = detect_project_name(tmp_path)
-        assert name == "my-node-project"
-
-    def test_from_pyproject_toml(self, tmp_path: Path):
-        """Should detect name from pyproject.toml."""
-        from init_wizard import detect_project_name
-
-        pyproject = tmp_path / "pyproject.toml"
-        pyproject.write_text('name = "my-python-project"\nversion = "1.0"')
-
-        name = detect_project_name(tmp_path)
-        assert name == "my-python-project"
-
-    def test_from_cargo_toml(self, tmp_path: Path):
-        """Should detect name from Cargo.toml."""
-        from init_wizard import detect_project_name
-
-        cargo = tmp_path / "Cargo.toml"
-        cargo.write_text('[package]\nname = "my-rust-project"')
-
-        name = detect_project_name(tmp_path)
-        assert name == "my-rust-project"
+    @pytest.mark.parametrize(
+        "filename,content,expected",
+        [
+            ("package.json", '{"name": "my-node-project"}', "my-node-project"),
+            (
+                "pyproject.toml",
+                'name = "my-python-project"\nversion = "1.0"',
+                "my-python-project",
+            ),
+            ("Cargo.toml", '[package]\nname = "my-rust-project"', "my-rust-project"),
+        ],
+    )
+    def test_from_manifest(
+        self, tmp_path: Path, filename: str, content: str, expected: str
+    ):
+        """Should detect name from package.json, pyproject.toml or Cargo.toml."""
+        (tmp_path / filename).write_text(content)
+
+        assert detect_project_name(tmp_path) == expected
 
     def test_fallback_to_directory_name(self, tmp_path: Path):
         """Should fallback to directory name when no package files."""
-        from init_wizard import detect_project_name
-
         name = detect_project_name(tmp_path)
         assert name == tmp_path.name
 
@@ -93,79 +89,46 @@ class TestDetectProjectName:
 class TestDetectLanguages:
     """Test language detection from files."""
 
-    def test_detects_python(self, tmp_path: Path):
-        """Should detect Python from .py files."""
-        from init_wizard import detect_languages
-
-        (tmp_path / "main.py").write_text("print('hello')")
-        langs = detect_languages(tmp_path)
-        assert "python" in langs
-
-    def test_detects_typescript(self, tmp_path: Path):
-        """Should detect TypeScript from .ts files."""
-        from init_wizard import detect_languages
-
-        (tmp_path / "app.ts").write_text("const x = 1;")
-        langs = detect_languages(tmp_path)
-        assert "typescript" in langs
-
-    def test_detects_rust(self, tmp_path: Path):
-        """Should detect Rust from .rs files."""
-        from init_wizard import detect_languages
-
-        (tmp_path / "lib.rs").write_text("fn main() {}")
-        langs = detect_languages(tmp_path)
-        assert "rust" in langs
-
-    def test_detects_multiple_languages(self, tmp_path: Path):
-        """Should detect multiple languages."""
-        from init_wizard import detect_languages
-
-        (tmp_path / "app.py").write_text("")
-        (tmp_path / "lib.ts").write_text("")
-        (tmp_path / "main.go").write_text("")
-
-        langs = detect_languages(tmp_path)
-        assert len(langs) >= 2
-
-    def test_limits_to_three_languages(self, tmp_path: Path):
-        """Should limit results to 3 languages."""
-        from init_wizard import detect_languages
-
-        # Create files for many languages
-        (tmp_path / "a.py").write_text("")
-        (tmp_path / "b.ts").write_text("")
-        (tmp_path / "c.go").write_text("")
-        (tmp_path / "d.rs").write_text("")
-        (tmp_path / "e.java").write_text("")
-
-        langs = detect_languages(tmp_path)
-        assert len(langs) <= 3
-
-    def test_empty_for_no_code_files(self, tmp_path: Path):
-        """Should return empty for directory with no code."""
-        from init_wizard import detect_languages
-
-        (tmp_path / "readme.md").write_text("")
-        langs = detect_languages(tmp_path)
-        assert langs == []
+    @pytest.mark.parametrize(
+        "suffixes,expected",
+        [
+            ([".py"], ["python"]),
+            ([".ts"], ["typescript"]),
+            ([".tsx", ".jsx"], ["typescript", "javascript"]),
+            ([".rs"], ["rust"]),
+            ([".py", ".ts", ".go"], ["python", "typescript", "go"]),
+            # Limited to the top 3 by priority
+            ([".py", ".ts", ".go", ".rs", ".java"], ["python", "typescript", "rust"]),
+            ([".md", ""], []),
+        ],
+    )
+    def test_classify_extensions(self, suffixes: list[str], expected: list[str]):
+        """Should map suffixes to the top languages in priority order."""
+        assert _classify_extensions(suffixes) == expected
+
+    def test_detects_languages_from_tree(self, tmp_path: Path):
+        """Should detect languages from source files, including nested ones."""
+        (tmp_path / "src" / "pkg").mkdir(parents=True)
+        (tmp_path / "src" / "pkg" / "mod.go").touch()
+        (tmp_path / "main.py").touch()
+        (tmp_path / "readme.md").touch()
+
+        assert detect_languages(tmp_path) == ["python", "go"]
 
 
 class TestCheckCliAvailable:
     """Test CLI availability checking."""
 
     def test_detects_available_command(self):
-        """Should detect available system commands."""
-        from init_wizard import check_cli_available
-
-        # ls should be available on all Unix systems
-        assert check_cli_available("ls") is True
+        """Should detect commands that resolve on PATH."""
+        with patch("init_wizard.shutil.which", return_value="/usr/bin/bd") as which:
+            assert check_cli_available("bd") is True
+        which.assert_called_once_with("bd")
 
     def test_detects_unavailable_command(self):
         """Should return False for non-existent commands."""
-        from init_wizard import check_cli_available
-
-        assert check_cli_available("definitely-not-a-real-command-xyz") is False
+        with patch("init_wizard.shutil.which", return_value=None):
+            assert check_cli_available("bd") is False
 
 
 class TestCheckTrackerAvailability:
@@ -173,30 +136,22 @@ class TestCheckTrackerAvailability:
 
     def test_builtin_always_available(self, tmp_path: Path):
         """Builtin tracker should always be available."""
-        from init_wizard import check_tracker_availability
-
         trackers = check_tracker_availability(tmp_path)
         assert trackers["builtin"]["available"] is True
         assert trackers["builtin"]["initialized"] is True
 
     def test_none_always_available(self, tmp_path: Path):
         """None tracker should always be available."""
-        from init_wizard import check_tracker_availability
-
         trackers = check_tracker_availability(tmp_path)
         assert trackers["none"]["available"] is True
 
     def test_markdown_always_available(self, tmp_path: Path):
         """Markdown tracker should always be available."""
-        from init_wizard import check_tracker_availability
-
         trackers = check_tracker_availability(tmp_path)
         assert trackers["markdown"]["available"] is True
 
     def test_beads_initialized_detection(self, tmp_path: Path):
         """Should detect initialized beads directory."""
-        from init_wizard import check_tracker_availability
-
         (tmp_path / ".beads").mkdir()
         trackers = check_tracker_availability(tmp_path)
         assert trackers["beads"]["initialized"] is True
@@ -207,9 +162,6 @@ class TestCreateConfigFile:
 
     def test_creates_config_file(self, tmp_path: Path):
         """Should create dp-config.yaml."""
-        from init_wizard import WizardConfig, create_config_file
-        from lib.config import TaskTracker
-
         config = WizardConfig(
             project_name="test-project",
             languages=["python"],
@@ -219,7 +171,6 @@ class TestCreateConfigFile:
         create_config_file(config, tmp_path)
 
         config_file = tmp_path / ".claude" / "dp-config.yaml"
-        assert config_file.exists()
         content = config_file.read_text()
         assert "test-project" in content
         assert "beads" in content
@@ -227,48 +178,59 @@ class TestCreateConfigFile:
 
     def test_creates_claude_directory(self, tmp_path: Path):
         """Should create .claude directory if missing."""
-        from init_wizard import WizardConfig, create_config_file
-
         config = WizardConfig(project_name="test")
         create_config_file(config, tmp_path)
 
         assert (tmp_path / ".claude").is_dir()
 
 
+@pytest.fixture
+def claude_dir(tmp_path: Path) -> Path:
+    """Project .claude directory, created up front."""
+    path = tmp_path / ".claude"
+    path.mkdir()
+    return path
+
+
 class TestCreateSettingsFile:
     """Test settings.json creation."""
 
-    def test_creates_settings_with_hooks(self, tmp_path: Path):
+    def test_creates_settings_with_hooks(self, claude_dir: Path):
         """Should create settings.json with hooks configured."""
-        from init_wizard import WizardConfig, create_settings_file
-
-        config = WizardConfig()
-        (tmp_path / ".claude").mkdir()
-        create_settings_file(config, tmp_path)
-
-        settings_file = tmp_path / ".claude" / "settings.json"
-        assert settings_file.exists()
+        create_settings_file(WizardConfig(), claude_dir.parent)
 
-        settings = json.loads(settings_file.read_text())
+        settings = json.loads((claude_dir / "settings.json").read_bytes())
         assert "hooks" in settings
         assert "SessionStart" in settings["hooks"]
         assert "UserPromptSubmit" in settings["hooks"]
 
-    def test_preserves_existing_settings(self, tmp_path: Path):
-        """Should preserve existing settings when adding hooks."""
-        from init_wizard import WizardConfig, create_settings_file
+    def test_creates_claude_directory(self, tmp_path: Path):
+        """Should create .claude directory if missing."""
+        create_settings_file(WizardConfig(), tmp_path)
+
+        assert (tmp_path / ".claude" / "settings.json").is_file()
 
-        claude_dir = tmp_path / ".claude"
-        claude_dir.mkdir()
+    def test_preserves_existing_settings(self, claude_dir: Path):
+        """Should preserve existing settings when adding hooks."""
         settings_file = claude_dir / "settings.json"
         settings_file.write_text('{"existing": "value"}')
 
-        config = WizardConfig()
-        create_settings_file(config, tmp_path)
+        create_settings_file(WizardConfig(), claude_dir.parent)
 
-        settings = json.loads(settings_file.read_text())
-        # New hooks should be added
+        settings = json.loads(settings_file.read_bytes())
+        # New hooks should be added alongside the existing keys
         assert "hooks" in settings
+        assert settings["existing"] == "value"
+
+    def test_replaces_unreadable_settings(self, claude_dir: Path):
+        """Should start fresh when existing settings are not valid JSON."""
+        settings_file = claude_dir / "settings.json"
+        settings_file.write_bytes(b"\xff{not json")
+
+        create_settings_file(WizardConfig(), claude_dir.parent)
+
+        settings = json.loads(settings_file.read_bytes())
+        assert list(settings) == ["hooks"]
 
 
 class TestCreateLanguageRules:
@@ -276,20 +238,15 @@ class TestCreateLanguageRules:
 
     def test_creates_python_rules(self, tmp_path: Path):
         """Should create Python rules file."""
-        from init_wizard import create_language_rules
-
         created = create_language_rules(["python"], tmp_path)
 
         assert len(created) == 1
         rules_file = tmp_path / ".claude" / "rules" / "python.md"
-        assert rules_file.exists()
         content = rules_file.read_text()
         assert "type hints" in content
 
     def test_creates_multiple_rules(self, tmp_path: Path):
         """Should create rules for multiple languages."""
-        from init_wizard import create_language_rules
-
         created = create_language_rules(["python", "typescript", "rust"], tmp_path)
 
         assert len(created) == 3
@@ -299,8 +256,6 @@ class TestCreateLanguageRules:
 
     def test_ignores_unknown_languages(self, tmp_path: Path):
         """Should skip languages without defined rules."""
-        from init_wizard import create_language_rules
-
         created = create_language_rules(["python", "unknown-lang"], tmp_path)
 
         assert len(created) == 1
@@ -312,12 +267,9 @@ class TestCreateSpecTemplate:
 
     def test_creates_overview_spec(self, tmp_path: Path):
         """Should create 00-overview.md spec file."""
-        from init_wizard import create_spec_template
-
         create_spec_template(tmp_path)
 
         spec_file = tmp_path / "docs" / "spec" / "00-overview.md"
-        assert spec_file.exists()
         content = spec_file.read_text()
         assert "[SPEC-00]" in content
         assert "[SPEC-00.01]" in content
@@ -328,12 +280,9 @@ class TestCreateAdrTemplate:
 
     def test_creates_adr_template(self, tmp_path: Path):
         """Should create ADR template file."""
-        from init_wizard import create_adr_template
-
         create_adr_template(tmp_path)
 
         template = tmp_path / "docs" / "adr" / "template.md"
-        assert template.exists()
         content = template.read_text()
         assert "Status" in content
         assert "Context" in content
@@ -341,87 +290,96 @@ class TestCreateAdrTemplate:
 
     def test_creates_initial_adr(self, tmp_path: Path):
         """Should create initial ADR for adopting disciplined process."""
-        from init_wizard import create_adr_template
-
         create_adr_template(tmp_path)
 
         initial = tmp_path / "docs" / "adr" / "0001-adopt-disciplined-process.md"
-        assert initial.exists()
         content = initial.read_text()
         assert "Accepted" in content
         assert "disciplined-process" in content
 
 
+@pytest.fixture(
+    params=[
+        PermissionError("Cannot write"),
+        FileNotFoundError("No such directory"),
+        OSError(28, "No space left on device"),
+    ],
+    ids=["permission", "not-found", "no-space"],
+)
+def config_write_error(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> OSError:
+    """Make create_config_file fail with each kind of OSError in turn."""
+    error = request.param
+
+    def raise_error(*_args: object) -> None:
+        raise error
+
+    monkeypatch.setattr("init_wizard.create_config_file", raise_error)
+    return error
+
+
 class TestExecuteSetup:
     """Test full setup execution."""
 
-    def test_creates_all_expected_files(self, tmp_path: Path):
+    def test_creates_all_expected_files(self, project: Path):
         """Should create all setup files."""
-        from init_wizard import WizardConfig, execute_setup
-        from lib.config import TaskTracker
-
         config = WizardConfig(
             project_name="test-project",
             languages=["python"],
             task_tracker=TaskTracker.BUILTIN,  # Avoid external dependencies
         )
 
-        results = execute_setup(config, tmp_path)
+        results = execute_setup(config, project)
 
         assert results["success"] is True
         assert ".claude/dp-config.yaml" in results["created"]
         assert ".claude/settings.json" in results["created"]
         assert "docs/spec/00-overview.md" in results["created"]
 
-    def test_handles_errors_gracefully(self, tmp_path: Path):
+    def test_handles_errors_gracefully(
+        self, tmp_path: Path, config_write_error: OSError
+    ):
         """Should handle errors and report them."""
-        from init_wizard import WizardConfig, execute_setup
+        results = execute_setup(WizardConfig(), tmp_path)
 
-        # Make directory read-only to cause errors
-        config = WizardConfig()
-
-        with patch("init_wizard.create_config_file") as mock:
-            mock.side_effect = PermissionError("Cannot write")
-            results = execute_setup(config, tmp_path)
-
-            assert results["success"] is False
-            assert len(results["errors"]) > 0
+        assert results["success"] is False
+        assert results["errors"] == [str(config_write_error)]
+        assert results["created"] == []
 
 
 class TestRunWizard:
     """Test wizard runner."""
 
-    def test_detects_project_info(self, tmp_path: Path):
+    def test_detects_project_info(self, canonical_project: Path):
         """Should detect project name and languages."""
-        from init_wizard import run_wizard
-
-        (tmp_path / "package.json").write_text('{"name": "detected-name"}')
-        (tmp_path / "src").mkdir()
-        (tmp_path / "src" / "app.ts").write_text("")
-
-        config = run_wizard(tmp_path)
+        config = run_wizard(canonical_project)
 
-        assert config.project_name == "detected-name"
+        assert config.project_name == "canonical-project"
         assert "typescript" in config.languages
 
+    @staticmethod
+    def select_tracker(
+        tmp_path: Path, cli_available: Callable[[str], bool]
+    ) -> TaskTracker:
+        """Run the wizard with discovery stubbed out so only tracker selection runs."""
+        with patch.multiple(
+            "init_wizard",
+            check_cli_available=cli_available,
+            detect_project_name=lambda _dir: "x",
+            detect_languages=lambda _dir: [],
+        ):
+            return run_wizard(tmp_path).task_tracker
+
     def test_prefers_beads_when_available(self, tmp_path: Path):
         """Should prefer Beads tracker when CLI is available."""
-        from init_wizard import run_wizard
-        from lib.config import TaskTracker
-
-        with patch("init_wizard.check_cli_available") as mock:
-            mock.return_value = True
-            config = run_wizard(tmp_path)
+        assert self.select_tracker(tmp_path, lambda _cmd: True) == TaskTracker.BEADS
 
-            assert config.task_tracker == TaskTracker.BEADS
+    def test_uses_chainlink_without_beads(self, tmp_path: Path):
+        """Should pick Chainlink when it is the only tracker CLI available."""
+        tracker = self.select_tracker(tmp_path, lambda cmd: cmd == "chainlink")
+        assert tracker == TaskTracker.CHAINLINK
 
     def test_falls_back_to_builtin(self, tmp_path: Path):
         """Should fall back to Builtin when no CLIs available."""
-        from init_wizard import run_wizard
-        from lib.config import TaskTracker
-
-        with patch("init_wizard.check_cli_available") as mock:
-            mock.return_value = False
-            config = run_wizard(tmp_path)
-
-            assert config.task_tracker == TaskTracker.BUILTIN
+        assert self.select_tracker(tmp_path, lambda _cmd: False) == TaskTracker.BUILTIN
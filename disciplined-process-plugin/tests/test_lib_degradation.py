@@ -11,29 +11,47 @@ Covers:
 from __future__ import annotations
 
 import json
-import os
-import sys
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
-from hypothesis import given, settings, strategies as st
-
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
-# Need to mock get_project_dir before importing degradation
-with patch.dict(os.environ, {"CLAUDE_PROJECT_DIR": "/tmp"}):
-    from lib.degradation import (
-        DegradationLevel,
-        HealthStatus,
-        SystemState,
-        _deserialize_state,
-        _serialize_state,
-        compute_degradation_level,
-        transition_to,
-    )
+from hypothesis import given, strategies as st
+
+from lib.degradation import (
+    DegradationLevel,
+    HealthStatus,
+    SystemState,
+    _deserialize_state,
+    _serialize_state,
+    compute_degradation_level,
+    get_state_file,
+    load_state,
+    save_state,
+    transition_to,
+)
+
+# Fixed timestamp for serialized state fixtures
+FIXED_ISO = "2024-01-01T00:00:00"
+
+# Every degradation level, for sampling in property tests
+ALL_LEVELS = tuple(DegradationLevel)
+
+# Pass-through string fields gain nothing from exotic Unicode draws
+PRINTABLE_ASCII = st.characters(min_codepoint=32, max_codepoint=126)
+
+# Shared property-test strategies
+LEVEL_STRATEGY = st.sampled_from(ALL_LEVELS)
+REASON_STRATEGY = st.text(alphabet=PRINTABLE_ASCII, min_size=1, max_size=100)
+
+# Healthy components shared by the degradation-level tests (read-only)
+HEALTHY_GIT = HealthStatus(healthy=True, component="git", message="OK")
+HEALTHY_CONFIG = HealthStatus(healthy=True, component="config", message="OK")
+HEALTHY_TRACKER = HealthStatus(healthy=True, component="task_tracker", message="OK")
+HEALTHY_COMPONENTS = {
+    "git": HEALTHY_GIT,
+    "config": HEALTHY_CONFIG,
+    "task_tracker": HEALTHY_TRACKER,
+}
 
 
 class TestDegradationLevel:
@@ -41,16 +59,21 @@ class TestDegradationLevel:
 
     def test_has_five_levels(self):
         """Should have exactly five degradation levels."""
-        levels = list(DegradationLevel)
-        assert len(levels) == 5
-
-    def test_level_names(self):
+        assert len(DegradationLevel) == 5
+
+    @pytest.mark.parametrize(
+        "level,expected",
+        [
+            (DegradationLevel.FULL, "FULL"),
+            (DegradationLevel.REDUCED, "REDUCED"),
+            (DegradationLevel.MANUAL, "MANUAL"),
+            (DegradationLevel.SAFE, "SAFE"),
+            (DegradationLevel.RECOVERY, "RECOVERY"),
+        ],
+    )
+    def test_level_names(self, level: DegradationLevel, expected: str):
         """Each level should have correct name."""
-        assert DegradationLevel.FULL.name == "FULL"
-        assert DegradationLevel.REDUCED.name == "REDUCED"
-        assert DegradationLevel.MANUAL.name == "MANUAL"
-        assert DegradationLevel.SAFE.name == "SAFE"
-        assert DegradationLevel.RECOVERY.name == "RECOVERY"
+        assert level.name == expected
 
     def test_levels_are_orderable_by_value(self):
         """Levels should be orderable by value for comparison."""
@@ -106,6 +129,13 @@ class TestSystemState:
         assert state.components == {}
         assert state.locked is False
 
+    def test_state_and_status_are_slotted(self):
+        """SystemState and HealthStatus should not carry a per-instance __dict__."""
+        state = SystemState(level=DegradationLevel.FULL)
+        status = HealthStatus(healthy=True, component="test", message="OK")
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(status, "__dict__")
+
     def test_add_component_status(self):
         """Should track component health statuses."""
         state = SystemState(level=DegradationLevel.FULL)
@@ -154,7 +184,7 @@ class TestStateSerialization:
         """Should deserialize state from dict."""
         data = {
             "level": "MANUAL",
-            "last_transition": datetime.now().isoformat(),
+            "last_transition": FIXED_ISO,
             "transition_reason": "Config issue",
             "locked": True,
             "lock_reason": "User locked",
@@ -163,7 +193,7 @@ class TestStateSerialization:
                     "healthy": False,
                     "component": "config",
                     "message": "Invalid config",
-                    "last_check": datetime.now().isoformat(),
+                    "last_check": FIXED_ISO,
                     "recovery_attempted": True,
                     "recovery_succeeded": False,
                 }
@@ -176,6 +206,8 @@ class TestStateSerialization:
         assert state.locked is True
         assert "config" in state.components
         assert state.components["config"].healthy is False
+        assert state.last_transition == datetime(2024, 1, 1)
+        assert state.components["config"].last_check == datetime(2024, 1, 1)
 
     def test_roundtrip_serialization(self):
         """State should survive serialize/deserialize roundtrip."""
@@ -199,25 +231,53 @@ class TestStateSerialization:
         assert restored.components["git"].healthy is False
 
 
+class TestStatePersistence:
+    """Tests for load_state/save_state."""
+
+    @pytest.fixture(autouse=True)
+    def project_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the state file at a fresh project directory."""
+        monkeypatch.setenv("CLAUDE_PROJECT_DIR", str(tmp_path))
+        return tmp_path
+
+    def test_roundtrip_through_state_file(self):
+        """Saved state should load back unchanged."""
+        original = SystemState(level=DegradationLevel.REDUCED, transition_reason="Test")
+        original.components["git"] = HEALTHY_GIT
+
+        save_state(original)
+
+        assert load_state() == original
+
+    def test_missing_state_file_loads_full(self):
+        """Should default to FULL when no state has been saved."""
+        assert load_state().level == DegradationLevel.FULL
+
+    @pytest.mark.parametrize(
+        "content", [b"{not json", b"\xff\xfe", b'{"level": "BOGUS"}']
+    )
+    def test_corrupt_state_file_loads_full(self, content: bytes):
+        """Should default to FULL when the state file cannot be parsed."""
+        state_file = get_state_file()
+        state_file.parent.mkdir(parents=True)
+        state_file.write_bytes(content)
+
+        assert load_state().level == DegradationLevel.FULL
+
+
 class TestComputeDegradationLevel:
     """Tests for compute_degradation_level function."""
 
     def test_full_when_all_healthy(self):
         """Should return FULL when all components healthy."""
-        components = {
-            "git": HealthStatus(healthy=True, component="git", message="OK"),
-            "config": HealthStatus(healthy=True, component="config", message="OK"),
-            "task_tracker": HealthStatus(healthy=True, component="task_tracker", message="OK"),
-        }
-
-        level = compute_degradation_level(components)
+        level = compute_degradation_level(HEALTHY_COMPONENTS)
         assert level == DegradationLevel.FULL
 
     def test_safe_when_git_unhealthy(self):
         """Should return SAFE when git is unhealthy."""
         components = {
+            **HEALTHY_COMPONENTS,
             "git": HealthStatus(healthy=False, component="git", message="Not found"),
-            "config": HealthStatus(healthy=True, component="config", message="OK"),
         }
 
         level = compute_degradation_level(components)
@@ -226,8 +286,10 @@ class TestComputeDegradationLevel:
     def test_manual_when_config_unhealthy(self):
         """Should return MANUAL when config is unhealthy."""
         components = {
-            "git": HealthStatus(healthy=True, component="git", message="OK"),
-            "config": HealthStatus(healthy=False, component="config", message="Invalid"),
+            **HEALTHY_COMPONENTS,
+            "config": HealthStatus(
+                healthy=False, component="config", message="Invalid"
+            ),
         }
 
         level = compute_degradation_level(components)
@@ -236,9 +298,10 @@ class TestComputeDegradationLevel:
     def test_reduced_when_task_tracker_unhealthy(self):
         """Should return REDUCED when task tracker is unhealthy."""
         components = {
-            "git": HealthStatus(healthy=True, component="git", message="OK"),
-            "config": HealthStatus(healthy=True, component="config", message="OK"),
-            "task_tracker": HealthStatus(healthy=False, component="task_tracker", message="Not found"),
+            **HEALTHY_COMPONENTS,
+            "task_tracker": HealthStatus(
+                healthy=False, component="task_tracker", message="Not found"
+            ),
         }
 
         level = compute_degradation_level(components)
@@ -278,24 +341,20 @@ class TestTransitionTo:
 class TestPropertyBasedDegradation:
     """Property-based tests for degradation module."""
 
-    @given(st.sampled_from(list(DegradationLevel)))
+    @given(LEVEL_STRATEGY)
     def test_any_level_can_be_set(self, level: DegradationLevel):
         """Any degradation level should be settable."""
         state = SystemState(level=level)
         assert state.level == level
 
-    @given(st.booleans(), st.text(min_size=1, max_size=50))
+    @given(st.booleans(), REASON_STRATEGY)
     def test_health_status_creation(self, healthy: bool, message: str):
         """HealthStatus should accept any valid inputs."""
         status = HealthStatus(healthy=healthy, component="test", message=message)
         assert status.healthy == healthy
         assert status.message == message
 
-    @given(
-        st.sampled_from(list(DegradationLevel)),
-        st.text(min_size=1, max_size=100),
-    )
-    @settings(max_examples=20)
+    @given(LEVEL_STRATEGY, REASON_STRATEGY)
     def test_state_serialization_roundtrip(self, level: DegradationLevel, reason: str):
         """State should survive serialization roundtrip."""
         original = SystemState(level=level, transition_reason=reason)
@@ -7,13 +7,13 @@ Pre-execution plan validation for disciplined-process.
 from __future__ import annotations
 
 import sys
-from pathlib import Path
+from dataclasses import FrozenInstanceError, fields
 from textwrap import dedent
+from unittest.mock import patch
 
 import pytest
 
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from lib import plan_validation
 from lib.plan_validation import (
     ValidationStatus,
     CoverageResult,
@@ -27,6 +27,20 @@ from lib.plan_validation import (
     format_validation_result,
 )
 
+# Multi-line task descriptions, dedented once at import
+ACCEPTANCE_CRITERIA_DESCRIPTION = dedent("""
+    Build the feature.
+
+    Acceptance Criteria:
+    - Feature works correctly
+    - Tests pass
+""")
+MUST_HAVE_DESCRIPTION = dedent("""
+    @must_have:
+      truth: User can send messages
+      artifact: src/Chat.tsx
+""")
+
 
 # @trace SPEC-06.01
 class TestValidationStatus:
@@ -100,6 +114,27 @@ class TestRequirementCoverage:
         results = check_requirement_coverage(specs, tasks)
         assert results[0].is_covered is True
 
+    def test_first_referencing_task_covers_spec(self):
+        """Spec referenced by several tasks should map to the first one."""
+        specs = [{"id": "SPEC-01.01", "title": "Login", "file": "spec/01.md"}]
+        tasks = [
+            {"id": "task-001", "title": "Form", "description": "@trace spec-01.01"},
+            {"id": "task-002", "title": "API", "description": "@trace SPEC-01.01"},
+        ]
+
+        results = check_requirement_coverage(specs, tasks)
+        assert results[0].task_id == "task-001"
+
+    def test_longer_spec_id_does_not_cover_prefix(self):
+        """SPEC-01.10 should not count as a mention of SPEC-01.1."""
+        specs = [{"id": "SPEC-01.1", "title": "Login", "file": "spec/01.md"}]
+        tasks = [
+            {"id": "task-001", "title": "Logout", "description": "@trace SPEC-01.10"}
+        ]
+
+        results = check_requirement_coverage(specs, tasks)
+        assert results[0].is_covered is False
+
 
 # @trace SPEC-06.20, SPEC-06.21
 class TestTaskCompleteness:
@@ -111,13 +146,7 @@ class TestTaskCompleteness:
             {
                 "id": "task-001",
                 "title": "Implement feature",
-                "description": dedent("""
-                    Build the feature.
-
-                    Acceptance Criteria:
-                    - Feature works correctly
-                    - Tests pass
-                """),
+                "description": ACCEPTANCE_CRITERIA_DESCRIPTION,
             }
         ]
 
@@ -159,17 +188,44 @@ class TestTaskCompleteness:
             {
                 "id": "task-004",
                 "title": "Build chat",
-                "description": dedent("""
-                    @must_have:
-                      truth: User can send messages
-                      artifact: src/Chat.tsx
-                """),
+                "description": MUST_HAVE_DESCRIPTION,
             }
         ]
 
         results = check_task_completeness(tasks)
         assert results[0].has_criteria is True
 
+    @pytest.mark.parametrize(
+        ("description", "criteria_type"),
+        [
+            ("Success criteria:\n- Fast", "Success Criteria"),
+            ("Done when: tests pass", "Done Criteria"),
+            ("Done criteria: shipped", "Done Criteria"),
+            ("@trace SPEC-01.01\nAcceptance Criteria:\n- Works", "Acceptance Criteria"),
+        ],
+    )
+    def test_criteria_type_reported(self, description: str, criteria_type: str):
+        """Should report the highest-priority criteria marker present."""
+        tasks = [{"id": "task-005", "title": "Task", "description": description}]
+
+        results = check_task_completeness(tasks)
+        assert results[0].criteria_type == criteria_type
+
+    @pytest.mark.parametrize(
+        "description",
+        [
+            "Acceptance criteria are still being discussed",
+            "Note: see @alice for details",
+            "",
+        ],
+    )
+    def test_near_miss_markers_are_incomplete(self, description: str):
+        """Text resembling a marker without matching one is not criteria."""
+        tasks = [{"id": "task-006", "title": "Task", "description": description}]
+
+        results = check_task_completeness(tasks)
+        assert results[0].has_criteria is False
+
 
 # @trace SPEC-06.30, SPEC-06.31
 class TestDependencyCorrectness:
@@ -186,6 +242,13 @@ class TestDependencyCorrectness:
         assert result.is_valid is True
         assert result.has_cycles is False
 
+    def test_task_without_title(self):
+        """Tasks with a None title should not break the dependency check."""
+        tasks = [{"id": "a", "title": None, "blockedBy": []}]
+
+        result = check_dependencies(tasks)
+        assert result.is_valid is True
+
     def test_linear_dependencies_valid(self):
         """Linear dependency chain should be valid."""
         tasks = [
@@ -219,6 +282,16 @@ class TestDependencyCorrectness:
         assert result.is_valid is False
         assert "task-999" in str(result.missing_refs)
 
+    def test_missing_references_deduplicated_and_sorted(self):
+        """Each dangling reference should be reported once, in order."""
+        tasks = [
+            {"id": "task-001", "blocks": ["task-999"], "blockedBy": ["task-500"]},
+            {"id": "task-002", "blocks": ["task-500"], "blockedBy": ["task-999"]},
+        ]
+
+        result = check_dependencies(tasks)
+        assert result.missing_refs == ("task-500", "task-999")
+
     def test_self_reference_detected(self):
         """Self-referencing task should be detected."""
         tasks = [
@@ -228,6 +301,49 @@ class TestDependencyCorrectness:
         result = check_dependencies(tasks)
         assert result.is_valid is False
 
+    def test_cycle_reported_as_path(self):
+        """A cycle through several tasks should be reported as one path."""
+        tasks = [
+            {"id": "task-001", "blocks": [], "blockedBy": ["task-003"]},
+            {"id": "task-002", "blocks": [], "blockedBy": ["task-001"]},
+            {"id": "task-003", "blocks": [], "blockedBy": ["task-002"]},
+        ]
+
+        result = check_dependencies(tasks)
+        assert result.cycles == ("task-001 -> task-002 -> task-003 -> task-001",)
+
+    def test_blocks_edges_do_not_form_cycles(self):
+        """Only blockedBy edges count towards cycles; blocks lists do not."""
+        tasks = [
+            {"id": "task-001", "blocks": ["task-002"], "blockedBy": []},
+            {"id": "task-002", "blocks": ["task-001"], "blockedBy": []},
+        ]
+
+        result = check_dependencies(tasks)
+        assert result.has_cycles is False
+        assert result.is_valid is True
+
+    def test_missing_references_with_mixed_id_types(self):
+        """Dangling numeric and string IDs should sort without a TypeError."""
+        tasks = [
+            {"id": "task-001", "blocks": [], "blockedBy": [7, "task-500"]},
+        ]
+
+        result = check_dependencies(tasks)
+        assert result.missing_refs == (7, "task-500")
+
+    def test_long_chain_does_not_recurse(self):
+        """Chains longer than the recursion limit should still be checked."""
+        count = sys.getrecursionlimit() + 100
+        tasks = [
+            {"id": f"task-{i}", "blocks": [], "blockedBy": [f"task-{i - 1}"]}
+            for i in range(1, count)
+        ]
+        tasks.insert(0, {"id": "task-0", "blocks": [], "blockedBy": []})
+
+        result = check_dependencies(tasks)
+        assert result.is_valid is True
+
 
 # @trace SPEC-06.50
 class TestValidatePlan:
@@ -267,6 +383,17 @@ class TestValidatePlan:
         result = validate_plan(specs, tasks)
         assert result.status in (ValidationStatus.WARN, ValidationStatus.PASS)
 
+    def test_task_without_title_or_description(self):
+        """A None title or description should validate like an empty one."""
+        specs = [{"id": "SPEC-01.01", "title": "Login", "file": "spec/01.md"}]
+        tasks = [
+            {"id": "task-001", "title": None, "description": None, "blockedBy": []}
+        ]
+
+        result = validate_plan(specs, tasks)
+        assert result.status == ValidationStatus.WARN
+        assert result.coverage[0].is_covered is False
+
     def test_fails_for_circular_deps(self):
         """Should return FAIL for circular dependencies."""
         specs = []
@@ -290,6 +417,47 @@ class TestValidatePlan:
         result = validate_plan(specs, tasks)
         assert result.status == ValidationStatus.FAIL
 
+    def test_indexes_tasks_once(self):
+        """All checks should share a single pass over the task list."""
+        specs = [{"id": "SPEC-01.01", "title": "Login", "file": "spec/01.md"}]
+        tasks = [
+            {
+                "id": "task-001",
+                "title": "Implement login",
+                "description": "@trace SPEC-01.01",
+                "blocks": [],
+                "blockedBy": [],
+            }
+        ]
+
+        with patch.object(
+            plan_validation, "_index_plan", wraps=plan_validation._index_plan
+        ) as index_plan:
+            result = validate_plan(specs, tasks)
+
+        index_plan.assert_called_once_with(tasks)
+        assert result.status == ValidationStatus.PASS
+
+
+class TestResultSlots:
+    """Tests for slotted, frozen validation result dataclasses."""
+
+    @pytest.mark.parametrize(
+        "result",
+        [
+            CoverageResult("SPEC-01.01", "Login", True, "task-001"),
+            TaskCompletenessResult("task-001", "Impl login", False),
+            DependencyResult(True, False),
+            PlanValidationResult(ValidationStatus.PASS),
+        ],
+        ids=lambda result: type(result).__name__,
+    )
+    def test_has_no_instance_dict(self, result: object):
+        """Results should be slotted and reject field assignment."""
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            setattr(result, fields(result)[0].name, None)
+
 
 # @trace SPEC-06.60, SPEC-06.61
 class TestValidationOutput:
@@ -349,3 +517,32 @@ class TestValidationOutput:
 
         output = format_validation_result(result)
         assert "circular" in output.lower() or "cycle" in output.lower()
+
+    def test_format_accepts_unhashable_values(self):
+        """Results carrying unhashable pass-through values should still format."""
+        result = PlanValidationResult(
+            status=ValidationStatus.WARN,
+            coverage=[CoverageResult("SPEC-01.02", ["Logout"], False, None)],  # type: ignore[arg-type]
+            warnings=["SPEC-01.02 has no implementing task"],
+        )
+
+        assert "SPEC-01.02" in format_validation_result(result)
+
+    def test_format_lists_every_issue(self):
+        """Each missing reference, warning and error gets its own line."""
+        result = PlanValidationResult(
+            status=ValidationStatus.FAIL,
+            dependencies=DependencyResult(False, False, ["task-500", "task-999"]),
+            warnings=["Task task-001 missing verification criteria"],
+            errors=[
+                "Reference to non-existent task: task-500",
+                "Reference to non-existent task: task-999",
+            ],
+        )
+
+        lines = format_validation_result(result).splitlines()
+        assert "  [FAIL] Missing reference: task-500" in lines
+        assert "  [FAIL] Missing reference: task-999" in lines
+        assert "  - Task task-001 missing verification criteria" in lines
+        assert "  - Reference to non-existent task: task-999" in lines
+        assert "  2 blocking, 1 warnings" in lines
@@ -9,18 +9,19 @@ Covers:
 
 from __future__ import annotations
 
-import sys
+import os
+import time
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from hypothesis import given, settings, strategies as st
 
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from lib.config import TaskTracker
 from lib.providers import (
     ProviderStatus,
+    beads_dir_exists,
     check_cli_available,
     check_provider_available,
     get_project_dir,
@@ -29,6 +30,10 @@ from lib.providers import (
     sync_tracker,
 )
 
+# Tracker values sampled by the property-based tests
+ALL_TRACKERS = tuple(TaskTracker)
+ALWAYS_AVAILABLE_TRACKERS = (TaskTracker.MARKDOWN, TaskTracker.NONE)
+
 
 class TestProviderStatus:
     """Tests for ProviderStatus dataclass."""
@@ -57,7 +62,21 @@ class TestProviderStatus:
         assert status.available is False
         assert status.reason == "CLI not found"
 
+    def test_is_immutable(self):
+        """Statuses should be frozen so shared instances stay intact."""
+        status = ProviderStatus(available=True)
+        with pytest.raises(FrozenInstanceError):
+            status.available = False
+
 
+@pytest.fixture(autouse=True)
+def _clear_provider_caches() -> None:
+    """Start every test with empty CLI and beads directory lookup caches."""
+    check_cli_available.cache_clear()
+    beads_dir_exists.cache_clear()
+
+
+@pytest.mark.xdist_group("cli")
 class TestCheckCliAvailable:
     """Tests for check_cli_available function."""
 
@@ -70,6 +89,14 @@ class TestCheckCliAvailable:
         """Nonexistent commands should return False."""
         assert check_cli_available("nonexistent_command_xyz_123") is False
 
+    def test_repeated_lookups_are_cached(self):
+        """Looking up the same command twice should walk PATH only once."""
+        with patch("lib.providers.shutil.which", return_value="/bin/ls") as which:
+            assert check_cli_available("ls") is True
+            assert check_cli_available("ls") is True
+
+        which.assert_called_once_with("ls")
+
 
 class TestCheckProviderAvailable:
     """Tests for check_provider_available function."""
@@ -95,6 +122,15 @@ class TestCheckProviderAvailable:
             status = check_provider_available(TaskTracker.BEADS, temp_project_dir)
             assert status.available is True
 
+    def test_beads_directory_lookup_is_cached(self, temp_project_dir: Path):
+        """Repeated beads checks for one project should stat .beads/ once."""
+        (temp_project_dir / ".beads").mkdir()
+        with patch("lib.providers.check_cli_available", return_value=True):
+            check_provider_available(TaskTracker.BEADS, temp_project_dir)
+            check_provider_available(TaskTracker.BEADS, temp_project_dir)
+
+        assert beads_dir_exists.cache_info().hits == 1
+
     def test_chainlink_unavailable_without_cli(self, temp_project_dir: Path):
         """Chainlink should be unavailable if CLI not found."""
         with patch("lib.providers.check_cli_available", return_value=False):
@@ -119,6 +155,12 @@ class TestCheckProviderAvailable:
         status = check_provider_available(TaskTracker.NONE, temp_project_dir)
         assert status.available is True
 
+    def test_always_available_status_is_shared(self, temp_project_dir: Path):
+        """CLI-free providers should return the same status instance."""
+        markdown = check_provider_available(TaskTracker.MARKDOWN, temp_project_dir)
+        none = check_provider_available(TaskTracker.NONE, temp_project_dir)
+        assert markdown is none
+
 
 class TestShouldWarnAboutProvider:
     """Tests for should_warn_about_provider function."""
@@ -134,6 +176,14 @@ class TestShouldWarnAboutProvider:
         warn_file.touch()
         assert should_warn_about_provider(warn_file) is False
 
+    def test_returns_true_when_warning_is_stale(self, temp_project_dir: Path):
+        """Should warn again once the last warning is over a day old."""
+        warn_file = temp_project_dir / ".dp-provider-warned"
+        warn_file.touch()
+        day_and_hour_ago = time.time() - 25 * 60 * 60
+        os.utime(warn_file, (day_and_hour_ago, day_and_hour_ago))
+        assert should_warn_about_provider(warn_file) is True
+
 
 class TestSyncTracker:
     """Tests for sync_tracker function."""
@@ -152,25 +202,23 @@ class TestSyncTracker:
 class TestPropertyBasedProviders:
     """Property-based tests for providers module."""
 
-    @given(st.sampled_from(list(TaskTracker)))
-    def test_all_trackers_return_status(self, tracker: TaskTracker):
+    @settings(max_examples=len(ALL_TRACKERS))
+    @given(st.sampled_from(ALL_TRACKERS))
+    def test_all_trackers_return_status(
+        self, shared_tmp_dir: Path, tracker: TaskTracker
+    ):
         """All tracker types should return a ProviderStatus."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_project_dir = Path(tmpdir)
-            with patch("lib.providers.check_cli_available", return_value=False):
-                status = check_provider_available(tracker, temp_project_dir)
+        with patch("lib.providers.check_cli_available", return_value=False):
+            status = check_provider_available(tracker, shared_tmp_dir)
 
-            assert isinstance(status, ProviderStatus)
-            assert isinstance(status.available, bool)
+        assert isinstance(status, ProviderStatus)
+        assert isinstance(status.available, bool)
 
-    @given(st.sampled_from([TaskTracker.MARKDOWN, TaskTracker.NONE]))
-    def test_always_available_trackers(self, tracker: TaskTracker):
+    @settings(max_examples=len(ALWAYS_AVAILABLE_TRACKERS))
+    @given(st.sampled_from(ALWAYS_AVAILABLE_TRACKERS))
+    def test_always_available_trackers(
+        self, shared_tmp_dir: Path, tracker: TaskTracker
+    ):
         """Markdown and None should always be available."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            temp_project_dir = Path(tmpdir)
-            status = check_provider_available(tracker, temp_project_dir)
-            assert status.available is True
+        status = check_provider_available(tracker, shared_tmp_dir)
+        assert status.available is True
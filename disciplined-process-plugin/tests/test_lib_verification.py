@@ -6,14 +6,11 @@ Goal-backward verification for disciplined-process.
 
 from __future__ import annotations
 
-import sys
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from lib.verification import (
     VerificationLevel,
     VerificationStatus,
@@ -74,6 +71,22 @@ class TestExtractTruths:
         truths = extract_truths_from_description(description)
         assert len(truths) >= 2
 
+    def test_extracts_success_criteria(self):
+        """Should add success criteria not already listed as acceptance criteria."""
+        description = dedent("""
+            Acceptance  criteria:
+            - Page loads
+
+            Success Criteria:
+
+            * Page loads
+            * Search returns results
+            Notes follow here.
+            - Not a criterion
+        """)
+        truths = extract_truths_from_description(description)
+        assert truths == ["Page loads", "Search returns results"]
+
     def test_returns_empty_for_no_criteria(self):
         """Should return empty list when no criteria found."""
         description = "Just a simple task with no criteria."
@@ -128,6 +141,21 @@ class TestArtifactChecks:
 
         result = check_artifact_exists(test_file)
         assert result.exists is True
+        assert result.line_count == 1
+
+    def test_counts_lines_of_large_artifact(self, tmp_path: Path):
+        """Should count lines of a file too large to read in one piece."""
+        test_file = tmp_path / "bundle.js"
+        test_file.write_text("var x = 1;\n" * 200_000 + "var y = 2;")
+
+        result = check_artifact_exists(test_file)
+        assert result.line_count == 200_001
+
+    def test_directory_is_not_an_artifact(self, tmp_path: Path):
+        """Should not treat a directory as an existing artifact file."""
+        (tmp_path / "src").mkdir()
+        result = check_artifact_exists(tmp_path / "src")
+        assert result.exists is False
 
     def test_artifact_not_exists(self, tmp_path: Path):
         """Should detect missing files."""
@@ -168,6 +196,24 @@ class TestArtifactChecks:
         result = check_artifact_substance(test_file)
         assert result.is_stub is True
 
+    def test_artifact_substance_sees_edits(self, tmp_path: Path):
+        """Should re-analyze a file after it changes."""
+        test_file = tmp_path / "auth.py"
+        test_file.write_text("# TODO: implement\npass\n")
+        assert check_artifact_substance(test_file).is_stub is True
+
+        test_file.write_text(dedent("""
+            import hashlib
+
+            def hash_password(password: str, salt: str) -> str:
+                '''Hash a password with salt.'''
+                return hashlib.sha256((password + salt).encode()).hexdigest()
+        """))
+
+        result = check_artifact_substance(test_file)
+        assert result.is_stub is False
+        assert result.line_count == 6
+
 
 # @trace SPEC-05.22
 class TestStubDetection:
@@ -283,6 +329,106 @@ class TestLinkChecks:
         )
         assert result.is_connected is False
 
+    def test_detects_require_link(self, tmp_path: Path):
+        """Should verify CommonJS require calls."""
+        db = tmp_path / "db.js"
+        db.write_text("module.exports = { query() { return []; } };")
+
+        server = tmp_path / "server.js"
+        server.write_text("const db = require('./db');\n")
+
+        result = check_link(
+            from_artifact=db,
+            to_artifact=server,
+            link_type="import",
+            search_root=tmp_path,
+        )
+        assert result.is_connected is True
+
+    def test_detects_multiline_python_import(self, tmp_path: Path):
+        """Should see symbols in a parenthesized Python import."""
+        utils = tmp_path / "utils.py"
+        utils.write_text("def helper():\n    return 1\n")
+
+        main = tmp_path / "main.py"
+        main.write_text(dedent("""
+            from utils import (
+                other,
+                helper,
+            )
+        """))
+
+        result = check_link(
+            from_artifact=utils,
+            to_artifact=main,
+            link_type="import",
+            search_root=tmp_path,
+            expected_symbol="helper",
+        )
+        assert result.is_connected is True
+
+    @pytest.mark.parametrize("source_name,statement", [
+        ("utils", "import utils.sub"),
+        ("api", "from app import api"),
+        ("api", "from app import (api as routes, models)"),
+    ])
+    @pytest.mark.parametrize("trailer", [
+        "",  # parses, so the ast scan is used
+        "def broken(:\n",  # syntax error, so the regex scan is used
+    ])
+    def test_detects_package_and_submodule_imports(
+        self, tmp_path: Path, source_name: str, statement: str, trailer: str
+    ):
+        """A dotted import or a from-imported name should link its module."""
+        source = tmp_path / f"{source_name}.py"
+        source.write_text("def helper():\n    return 1\n")
+
+        main = tmp_path / "main.py"
+        main.write_text(f"{statement}\n{trailer}")
+
+        result = check_link(
+            from_artifact=source,
+            to_artifact=main,
+            link_type="import",
+            search_root=tmp_path,
+        )
+        assert result.is_connected is True
+
+    def test_ignores_import_mentioned_mid_line(self, tmp_path: Path):
+        """Should not count the word import inside a comment as an import."""
+        utils = tmp_path / "utils.py"
+        utils.write_text("def helper():\n    return 1\n")
+
+        main = tmp_path / "main.py"
+        main.write_text("x = 1  # import utils once it is ready\n")
+
+        result = check_link(
+            from_artifact=utils,
+            to_artifact=main,
+            link_type="import",
+            search_root=tmp_path,
+        )
+        assert result.is_connected is False
+
+    def test_sees_import_added_later(self, tmp_path: Path):
+        """Should re-scan the target file after it changes."""
+        db = tmp_path / "db.js"
+        db.write_text("module.exports = { query() { return []; } };")
+        server = tmp_path / "server.js"
+        server.write_text("const app = {};\n")
+
+        def link():
+            return check_link(
+                from_artifact=db,
+                to_artifact=server,
+                link_type="import",
+                search_root=tmp_path,
+            )
+
+        assert link().is_connected is False
+        server.write_text("const db = require('./db');\n")
+        assert link().is_connected is True
+
 
 # @trace SPEC-05.32
 class TestUnwiredPatternDetection:
@@ -317,6 +463,23 @@ class TestUnwiredPatternDetection:
         )
         assert result.is_connected is False
 
+    def test_detects_used_export(self, tmp_path: Path):
+        """Should confirm an expected symbol that is imported."""
+        utils = tmp_path / "utils.py"
+        utils.write_text("def helper_function():\n    return 'help'\n")
+
+        main = tmp_path / "main.py"
+        main.write_text("from utils import other, helper_function as helper\n")
+
+        result = check_link(
+            from_artifact=utils,
+            to_artifact=main,
+            link_type="import",
+            search_root=tmp_path,
+            expected_symbol="helper_function",
+        )
+        assert result.is_connected is True
+
 
 # @trace SPEC-05.40, SPEC-05.41
 class TestVerifyTask:
@@ -405,6 +568,46 @@ class TestVerifyTask:
         result = verify_task(task, project_root=tmp_path)
         assert result.status in (VerificationStatus.INCOMPLETE, VerificationStatus.FAILED)
 
+    def test_checks_many_artifacts(self, tmp_path: Path):
+        """Should check every listed artifact, however many there are."""
+        for name in ("a", "b", "c", "d"):
+            (tmp_path / f"{name}.py").write_text("# TODO: implement\npass\n")
+
+        task = {
+            "id": "test-003",
+            "title": "Implement modules",
+            "description": "Artifacts:\n- a.py\n- b.py\n- c.py\n- d.py\n- e.py\n",
+        }
+
+        result = verify_task(task, project_root=tmp_path)
+        by_name = {a.path.name: a for a in result.artifacts}
+        assert sorted(by_name) == ["a.py", "b.py", "c.py", "d.py", "e.py"]
+        assert by_name["e.py"].exists is False
+        assert all(by_name[n].is_stub for n in ("a.py", "b.py", "c.py", "d.py"))
+        assert result.status == VerificationStatus.FAILED
+
+    def test_checks_repeated_artifact_once(self, tmp_path: Path):
+        """Should report an artifact listed several ways only once, in listed order."""
+        task = {
+            "id": "test-004",
+            "title": "Implement modules",
+            "description": dedent("""
+                Artifacts:
+                - src/b.py
+                - ./src/a.py
+
+                @must_have:
+                  artifact: src/lib/../a.py
+                  artifact: src/b.py
+            """),
+        }
+
+        result = verify_task(task, project_root=tmp_path)
+        assert [a.path for a in result.artifacts] == [
+            tmp_path / "src" / "b.py",
+            tmp_path / "src" / "a.py",
+        ]
+
 
 # @trace SPEC-05.50, SPEC-05.51
 class TestVerificationOutput:
@@ -522,6 +725,15 @@ class TestErrorHandling:
         result = verify_task(task, project_root=Path("/tmp"))
         # Should not raise, should return a result
         assert result is not None
+        assert result.task_id == "unknown"
+        assert result.status == VerificationStatus.INCOMPLETE
+
+    def test_no_criteria_is_incomplete(self, tmp_path: Path):
+        """Should report INCOMPLETE when the description lists nothing to check."""
+        task = {"id": "test", "description": "Just a simple task."}
+        result = verify_task(task, project_root=tmp_path)
+        assert result.status == VerificationStatus.INCOMPLETE
+        assert result.truths == () and result.artifacts == ()
 
     def test_verification_is_readonly(self, tmp_path: Path):
         """Verification should not modify files."""
@@ -7,14 +7,36 @@ Tests for migrate.py migration script.
 from __future__ import annotations
 
 import json
-import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from migrate import (
+    IssueMapping,
+    MigrationResult,
+    embed_labels_in_description,
+    embed_metadata_in_subject,
+    extract_labels_from_description,
+    extract_metadata_from_subject,
+    extract_spec_refs,
+    map_beads_priority,
+    map_chainlink_priority,
+    migrate_beads_to_builtin,
+    migrate_beads_to_chainlink,
+    migrate_builtin_to_beads,
+    migrate_chainlink_to_beads,
+    parse_beads_issues,
+    save_mapping_file,
+    update_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_subprocess_run(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Stand in for every CLI call migrate makes; each one reports success."""
+    mock = MagicMock(return_value=MagicMock(returncode=0))
+    monkeypatch.setattr("migrate.subprocess.run", mock)
+    return mock
 
 
 class TestIssueMapping:
@@ -22,8 +44,6 @@ class TestIssueMapping:
 
     def test_basic_mapping(self):
         """Should store source to target mapping."""
-        from migrate import IssueMapping
-
         mapping = IssueMapping(
             source_id="bd-001",
             target_id="CL-1",
@@ -38,8 +58,6 @@ class TestIssueMapping:
 
     def test_default_spec_refs(self):
         """Should default to empty spec_refs."""
-        from migrate import IssueMapping
-
         mapping = IssueMapping(
             source_id="a", target_id="b", title="c"
         )
@@ -51,8 +69,6 @@ class TestMigrationResult:
 
     def test_successful_result(self):
         """Should represent successful migration."""
-        from migrate import IssueMapping, MigrationResult
-
         result = MigrationResult(
             success=True,
             source="beads",
@@ -68,8 +84,6 @@ class TestMigrationResult:
 
     def test_failed_result_with_errors(self):
         """Should include errors on failure."""
-        from migrate import MigrationResult
-
         result = MigrationResult(
             success=False,
             source="beads",
@@ -89,14 +103,17 @@ class TestParseBeadsIssues:
 
     def test_parses_jsonl_file(self, tmp_path: Path):
         """Should parse issues from JSONL format."""
-        from migrate import parse_beads_issues
-
         beads_dir = tmp_path / ".beads"
         beads_dir.mkdir()
         issues_file = beads_dir / "issues.jsonl"
-        issues_file.write_text(
-            '{"id": "bd-001", "title": "First"}\n'
-            '{"id": "bd-002", "title": "Second"}\n'
+        issues_file.write_bytes(
+            b"\n".join(
+                [
+                    b'{"id": "bd-001", "title": "First"}',
+                    b'{"id": "bd-002", "title": "Second"}',
+                    b"",  # trailing newline
+                ]
+            )
         )
 
         issues = parse_beads_issues(beads_dir)
@@ -107,15 +124,18 @@ class TestParseBeadsIssues:
 
     def test_skips_empty_lines(self, tmp_path: Path):
         """Should skip empty lines in JSONL."""
-        from migrate import parse_beads_issues
-
         beads_dir = tmp_path / ".beads"
         beads_dir.mkdir()
         issues_file = beads_dir / "issues.jsonl"
-        issues_file.write_text(
-            '{"id": "bd-001", "title": "First"}\n'
-            '\n'
-            '{"id": "bd-002", "title": "Second"}\n'
+        issues_file.write_bytes(
+            b"\n".join(
+                [
+                    b'{"id": "bd-001", "title": "First"}',
+                    b"",
+                    b'{"id": "bd-002", "title": "Second"}',
+                    b"",  # trailing newline
+                ]
+            )
         )
 
         issues = parse_beads_issues(beads_dir)
@@ -123,8 +143,6 @@ class TestParseBeadsIssues:
 
     def test_raises_on_missing_file(self, tmp_path: Path):
         """Should raise error if issues file not found."""
-        from migrate import parse_beads_issues
-
         beads_dir = tmp_path / ".beads"
         beads_dir.mkdir()
         # No issues.jsonl created
@@ -138,8 +156,6 @@ class TestExtractSpecRefs:
 
     def test_extracts_single_spec(self):
         """Should extract single spec reference."""
-        from migrate import extract_spec_refs
-
         text = "Implements [SPEC-01.05] for user login"
         refs = extract_spec_refs(text)
 
@@ -147,8 +163,6 @@ class TestExtractSpecRefs:
 
     def test_extracts_multiple_specs(self):
         """Should extract multiple spec references."""
-        from migrate import extract_spec_refs
-
         text = "Covers [SPEC-01.01] and [SPEC-02.03]"
         refs = extract_spec_refs(text)
 
@@ -158,8 +172,6 @@ class TestExtractSpecRefs:
 
     def test_returns_empty_for_no_specs(self):
         """Should return empty list when no specs found."""
-        from migrate import extract_spec_refs
-
         text = "Just a regular description without specs"
         refs = extract_spec_refs(text)
 
@@ -167,8 +179,6 @@ class TestExtractSpecRefs:
 
     def test_handles_none_text(self):
         """Should handle None text gracefully."""
-        from migrate import extract_spec_refs
-
         refs = extract_spec_refs(None)
         assert refs == []
 
@@ -176,36 +186,29 @@ class TestExtractSpecRefs:
 class TestPriorityMapping:
     """Test priority conversion between trackers."""
 
-    def test_beads_to_chainlink_mapping(self):
+    @pytest.mark.parametrize(
+        "priority,expected",
+        [(0, "critical"), (1, "high"), (2, "medium"), (3, "low"), (4, "low")],
+    )
+    def test_beads_to_chainlink_mapping(self, priority: int, expected: str):
         """Should map Beads numeric priorities to Chainlink strings."""
-        from migrate import map_beads_priority
+        assert map_beads_priority(priority) == expected
 
-        assert map_beads_priority(0) == "critical"
-        assert map_beads_priority(1) == "high"
-        assert map_beads_priority(2) == "medium"
-        assert map_beads_priority(3) == "low"
-        assert map_beads_priority(4) == "low"
-
-    def test_chainlink_to_beads_mapping(self):
+    @pytest.mark.parametrize(
+        "priority,expected",
+        [("critical", 0), ("high", 1), ("medium", 2), ("low", 3)],
+    )
+    def test_chainlink_to_beads_mapping(self, priority: str, expected: int):
         """Should map Chainlink string priorities to Beads numeric."""
-        from migrate import map_chainlink_priority
-
-        assert map_chainlink_priority("critical") == 0
-        assert map_chainlink_priority("high") == 1
-        assert map_chainlink_priority("medium") == 2
-        assert map_chainlink_priority("low") == 3
+        assert map_chainlink_priority(priority) == expected
 
-    def test_case_insensitive_chainlink_mapping(self):
+    @pytest.mark.parametrize("priority,expected", [("HIGH", 1), ("Medium", 2)])
+    def test_case_insensitive_chainlink_mapping(self, priority: str, expected: int):
         """Should handle case-insensitive Chainlink priorities."""
-        from migrate import map_chainlink_priority
-
-        assert map_chainlink_priority("HIGH") == 1
-        assert map_chainlink_priority("Medium") == 2
+        assert map_chainlink_priority(priority) == expected
 
     def test_default_for_unknown_priority(self):
         """Should default to medium for unknown priorities."""
-        from migrate import map_beads_priority, map_chainlink_priority
-
         assert map_beads_priority(99) == "medium"
         assert map_chainlink_priority("unknown") == 2
 
@@ -213,79 +216,42 @@ class TestPriorityMapping:
 class TestMetadataEmbedding:
     """Test metadata embedding in task subjects."""
 
-    def test_embed_priority(self):
-        """Should embed priority as prefix."""
-        from migrate import embed_metadata_in_subject
-
-        subject = embed_metadata_in_subject("Fix bug", priority=1)
-        assert subject == "[P1] Fix bug"
-
-    def test_embed_type(self):
-        """Should embed issue type as prefix."""
-        from migrate import embed_metadata_in_subject
-
-        subject = embed_metadata_in_subject("Add feature", issue_type="feature")
-        assert subject == "[feature] Add feature"
-
-    def test_embed_both(self):
-        """Should embed both priority and type."""
-        from migrate import embed_metadata_in_subject
-
-        subject = embed_metadata_in_subject("Critical bug", priority=0, issue_type="bug")
-        assert subject == "[P0] [bug] Critical bug"
-
-    def test_no_embedding_with_none(self):
-        """Should return original title when no metadata."""
-        from migrate import embed_metadata_in_subject
-
-        subject = embed_metadata_in_subject("Plain title")
-        assert subject == "Plain title"
+    @pytest.mark.parametrize(
+        "title,metadata,expected",
+        [
+            ("Fix bug", {"priority": 1}, "[P1] Fix bug"),
+            ("Add feature", {"issue_type": "feature"}, "[feature] Add feature"),
+            (
+                "Critical bug",
+                {"priority": 0, "issue_type": "bug"},
+                "[P0] [bug] Critical bug",
+            ),
+            ("Plain title", {}, "Plain title"),
+        ],
+        ids=["priority", "type", "both", "none"],
+    )
+    def test_embed_metadata(self, title: str, metadata: dict, expected: str):
+        """Should prefix the subject with whatever metadata is given."""
+        assert embed_metadata_in_subject(title, **metadata) == expected
 
 
 class TestMetadataExtraction:
     """Test metadata extraction from task subjects."""
 
-    def test_extract_priority_only(self):
-        """Should extract priority from subject."""
-        from migrate import extract_metadata_from_subject
-
-        title, priority, issue_type = extract_metadata_from_subject("[P1] Fix bug")
-
-        assert title == "Fix bug"
-        assert priority == 1
-        assert issue_type == "task"  # Default
-
-    def test_extract_type_only(self):
-        """Should extract type from subject."""
-        from migrate import extract_metadata_from_subject
-
-        title, priority, issue_type = extract_metadata_from_subject("[bug] Fix error")
-
-        assert title == "Fix error"
-        assert priority == 2  # Default
-        assert issue_type == "bug"
-
-    def test_extract_both(self):
-        """Should extract both priority and type."""
-        from migrate import extract_metadata_from_subject
-
-        title, priority, issue_type = extract_metadata_from_subject(
-            "[P0] [feature] New login"
-        )
-
-        assert title == "New login"
-        assert priority == 0
-        assert issue_type == "feature"
-
-    def test_extract_plain_subject(self):
-        """Should handle plain subjects without metadata."""
-        from migrate import extract_metadata_from_subject
-
-        title, priority, issue_type = extract_metadata_from_subject("Plain title")
-
-        assert title == "Plain title"
-        assert priority == 2  # Default medium
-        assert issue_type == "task"  # Default
+    @pytest.mark.parametrize(
+        "subject,expected",
+        [
+            # Missing fields fall back to medium priority and the "task" type
+            ("[P1] Fix bug", ("Fix bug", 1, "task")),
+            ("[bug] Fix error", ("Fix error", 2, "bug")),
+            ("[P0] [feature] New login", ("New login", 0, "feature")),
+            ("Plain title", ("Plain title", 2, "task")),
+        ],
+        ids=["priority", "type", "both", "plain"],
+    )
+    def test_extract_metadata(self, subject: str, expected: tuple[str, int, str]):
+        """Should split priority and type prefixes off the subject."""
+        assert extract_metadata_from_subject(subject) == expected
 
 
 class TestLabelEmbedding:
@@ -293,8 +259,6 @@ class TestLabelEmbedding:
 
     def test_embed_labels(self):
         """Should append labels to description."""
-        from migrate import embed_labels_in_description
-
         desc = embed_labels_in_description("Original description", ["urgent", "frontend"])
 
         assert "Original description" in desc
@@ -302,8 +266,6 @@ class TestLabelEmbedding:
 
     def test_no_labels(self):
         """Should return unchanged description with no labels."""
-        from migrate import embed_labels_in_description
-
         desc = embed_labels_in_description("Original", [])
         assert desc == "Original"
 
@@ -313,8 +275,6 @@ class TestLabelExtraction:
 
     def test_extract_labels(self):
         """Should extract labels from description footer."""
-        from migrate import extract_labels_from_description
-
         text = "Description text\n\n---\nLabels: bug, urgent, P1"
         desc, labels = extract_labels_from_description(text)
 
@@ -325,8 +285,6 @@ class TestLabelExtraction:
 
     def test_no_labels_in_description(self):
         """Should return empty labels when none embedded."""
-        from migrate import extract_labels_from_description
-
         desc, labels = extract_labels_from_description("Plain description")
 
         assert desc == "Plain description"
@@ -338,33 +296,18 @@ class TestMigrateBeadsToChainlink:
 
     def test_fails_without_beads_dir(self, tmp_path: Path):
         """Should fail if .beads directory doesn't exist."""
-        from migrate import migrate_beads_to_chainlink
-
         result = migrate_beads_to_chainlink(tmp_path, dry_run=True)
 
         assert result.success is False
         assert ".beads/ directory not found" in result.errors
 
-    def test_dry_run_creates_no_issues(self, tmp_path: Path):
+    def test_dry_run_creates_no_issues(self, beads_project: Path):
         """Should not create issues in dry run mode."""
-        from migrate import migrate_beads_to_chainlink
-
-        # Create mock beads setup
-        beads_dir = tmp_path / ".beads"
-        beads_dir.mkdir()
-        (beads_dir / "issues.jsonl").write_text(
-            '{"id": "bd-001", "title": "Test Issue", "priority": 2}\n'
-        )
-
-        with patch("migrate.subprocess.run") as mock_run:
-            # Mock chainlink check
-            mock_run.return_value = MagicMock(returncode=0)
+        result = migrate_beads_to_chainlink(beads_project, dry_run=True)
 
-            result = migrate_beads_to_chainlink(tmp_path, dry_run=True)
-
-            # Should report issue but not actually create
-            assert result.issues_migrated == 1
-            assert len(result.mappings) == 1
+        # Should report issue but not actually create
+        assert result.issues_migrated == 1
+        assert len(result.mappings) == 1
 
 
 class TestMigrateChainlinkToBeads:
@@ -372,8 +315,6 @@ class TestMigrateChainlinkToBeads:
 
     def test_fails_without_chainlink_dir(self, tmp_path: Path):
         """Should fail if .chainlink directory doesn't exist."""
-        from migrate import migrate_chainlink_to_beads
-
         result = migrate_chainlink_to_beads(tmp_path, dry_run=True)
 
         assert result.success is False
@@ -385,25 +326,14 @@ class TestMigrateBeadsToBuiltin:
 
     def test_fails_without_beads_dir(self, tmp_path: Path):
         """Should fail if .beads directory doesn't exist."""
-        from migrate import migrate_beads_to_builtin
-
         result = migrate_beads_to_builtin(tmp_path, dry_run=True)
 
         assert result.success is False
         assert ".beads/ directory not found" in result.errors
 
-    def test_dry_run_reports_issues(self, tmp_path: Path):
+    def test_dry_run_reports_issues(self, beads_project: Path):
         """Should report issues in dry run without creating."""
-        from migrate import migrate_beads_to_builtin
-
-        # Create mock beads setup
-        beads_dir = tmp_path / ".beads"
-        beads_dir.mkdir()
-        (beads_dir / "issues.jsonl").write_text(
-            '{"id": "bd-001", "title": "Test", "priority": 1, "issue_type": "bug"}\n'
-        )
-
-        result = migrate_beads_to_builtin(tmp_path, dry_run=True)
+        result = migrate_beads_to_builtin(beads_project, dry_run=True)
 
         assert result.issues_migrated == 1
         assert result.mappings[0].source_id == "bd-001"
@@ -414,19 +344,13 @@ class TestMigrateBuiltinToBeads:
 
     def test_succeeds_with_no_tasks(self, tmp_path: Path):
         """Should succeed when no builtin tasks exist."""
-        from migrate import migrate_builtin_to_beads
-
-        with patch("migrate.subprocess.run") as mock_run:
-            # Mock bd check as available
-            mock_run.return_value = MagicMock(returncode=0)
-
-            with patch("migrate.builtin_provider.list_tasks") as mock_list:
-                mock_list.return_value = []
+        with patch("migrate.builtin_provider.list_tasks") as mock_list:
+            mock_list.return_value = []
 
-                result = migrate_builtin_to_beads(tmp_path, dry_run=True)
+            result = migrate_builtin_to_beads(tmp_path, dry_run=True)
 
-                assert result.success is True
-                assert result.issues_migrated == 0
+            assert result.success is True
+            assert result.issues_migrated == 0
 
 
 class TestSaveMappingFile:
@@ -434,8 +358,6 @@ class TestSaveMappingFile:
 
     def test_saves_mapping_json(self, tmp_path: Path):
         """Should save mapping file in JSON format."""
-        from migrate import IssueMapping, MigrationResult, save_mapping_file
-
         result = MigrationResult(
             success=True,
             source="beads",
@@ -453,7 +375,7 @@ class TestSaveMappingFile:
         mapping_file = tmp_path / ".claude" / "dp-migration-map.json"
         assert mapping_file.exists()
 
-        data = json.loads(mapping_file.read_text())
+        data = json.loads(mapping_file.read_bytes())
         assert data["source"] == "beads"
         assert data["target"] == "builtin"
         assert len(data["mappings"]) == 2
@@ -464,8 +386,6 @@ class TestUpdateConfig:
 
     def test_updates_tracker_setting(self, tmp_path: Path):
         """Should update task_tracker in config file."""
-        from migrate import update_config
-
         # Create config file
         claude_dir = tmp_path / ".claude"
         claude_dir.mkdir()
@@ -485,7 +405,5 @@ class TestUpdateConfig:
 
     def test_handles_missing_config(self, tmp_path: Path):
         """Should handle missing config file gracefully."""
-        from migrate import update_config
-
         # Should not raise
         update_config("builtin", tmp_path)
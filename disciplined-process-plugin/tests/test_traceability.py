@@ -10,14 +10,13 @@ Covers:
 
 from __future__ import annotations
 
-import sys
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 from hypothesis import given, settings, strategies as st
 
-# Import module under test
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 from traceability import (
     ISSUE_LINK_PATTERN,
     SPEC_ID_PATTERN,
@@ -28,34 +27,31 @@ from traceability import (
     find_trace_markers,
     format_coverage_report,
     generate_coverage_report,
+    get_issue_status,
+    link_spec_to_issue,
     parse_all_specs,
     parse_specs_from_file,
+    unlink_spec,
 )
 
 
 class TestSpecIdPattern:
     """Tests for SPEC_ID_PATTERN regex."""
 
-    def test_matches_section_only(self):
-        """[SPEC-01] should match with section only."""
-        match = SPEC_ID_PATTERN.search("[SPEC-01]")
-        assert match is not None
-        assert match.group(1) == "01"
-        assert match.group(2) is None
-
-    def test_matches_section_and_paragraph(self):
-        """[SPEC-01.03] should match with section and paragraph."""
-        match = SPEC_ID_PATTERN.search("[SPEC-01.03]")
-        assert match is not None
-        assert match.group(1) == "01"
-        assert match.group(2) == "03"
-
-    def test_matches_in_line(self):
-        """Should find spec ID embedded in text."""
-        match = SPEC_ID_PATTERN.search("Requirement [SPEC-05.12] states that...")
+    @pytest.mark.parametrize(
+        "text,section,paragraph",
+        [
+            ("[SPEC-01]", "01", None),
+            ("[SPEC-01.03]", "01", "03"),
+            ("Requirement [SPEC-05.12] states that...", "05", "12"),
+        ],
+    )
+    def test_matches_spec_id(self, text: str, section: str, paragraph: str | None):
+        """Should match a bracketed spec ID, alone or embedded in text."""
+        match = SPEC_ID_PATTERN.search(text)
         assert match is not None
-        assert match.group(1) == "05"
-        assert match.group(2) == "12"
+        assert match.group(1) == section
+        assert match.group(2) == paragraph
 
     def test_no_match_without_brackets(self):
         """SPEC-01 without brackets should not match."""
@@ -74,25 +70,20 @@ class TestSpecIdPattern:
 class TestIssueLinkPattern:
     """Tests for ISSUE_LINK_PATTERN regex."""
 
-    def test_matches_chainlink_link(self):
-        """Should match chainlink issue links."""
-        match = ISSUE_LINK_PATTERN.search("<!-- chainlink:15 -->")
-        assert match is not None
-        assert match.group(1) == "chainlink"
-        assert match.group(2) == "15"
-
-    def test_matches_beads_link(self):
-        """Should match beads issue links."""
-        match = ISSUE_LINK_PATTERN.search("<!-- beads:bd-a1b2 -->")
-        assert match is not None
-        assert match.group(1) == "beads"
-        assert match.group(2) == "bd-a1b2"
-
-    def test_matches_with_extra_spaces(self):
-        """Should match with varying whitespace."""
-        match = ISSUE_LINK_PATTERN.search("<!--   chainlink:1   -->")
+    @pytest.mark.parametrize(
+        "text,provider,issue_id",
+        [
+            ("<!-- chainlink:15 -->", "chainlink", "15"),
+            ("<!-- beads:bd-a1b2 -->", "beads", "bd-a1b2"),
+            ("<!--   chainlink:1   -->", "chainlink", "1"),
+        ],
+    )
+    def test_matches_issue_link(self, text: str, provider: str, issue_id: str):
+        """Should match chainlink and beads links with varying whitespace."""
+        match = ISSUE_LINK_PATTERN.search(text)
         assert match is not None
-        assert match.group(2) == "1"
+        assert match.group(1) == provider
+        assert match.group(2) == issue_id
 
     def test_no_match_for_other_comments(self):
         """Should not match regular HTML comments."""
@@ -103,33 +94,23 @@ class TestIssueLinkPattern:
 class TestTracePattern:
     """Tests for TRACE_PATTERN regex."""
 
-    def test_matches_basic_trace(self):
-        """@trace SPEC-01.03 should match."""
-        match = TRACE_PATTERN.search("# @trace SPEC-01.03")
-        assert match is not None
-        assert match.group(1) == "01"
-        assert match.group(2) == "03"
-        assert match.group(3) is None
-
-    def test_matches_trace_with_sub_item(self):
-        """@trace SPEC-01.03.a should match with sub-item."""
-        match = TRACE_PATTERN.search("# @trace SPEC-01.03.a")
+    @pytest.mark.parametrize(
+        "text,sub_item",
+        [
+            ("# @trace SPEC-01.03", None),
+            ("# @trace SPEC-01.03.a", "a"),
+            ("// @trace SPEC-01.03", None),
+            ("/* @trace SPEC-01.03 */", None),
+            ("   @trace SPEC-01.03  # validation", None),
+        ],
+    )
+    def test_matches_trace(self, text: str, sub_item: str | None):
+        """Should match in any comment style, with an optional sub-item."""
+        match = TRACE_PATTERN.search(text)
         assert match is not None
         assert match.group(1) == "01"
         assert match.group(2) == "03"
-        assert match.group(3) == "a"
-
-    def test_matches_in_various_comment_styles(self):
-        """Should match in Python, JS, and other comment styles."""
-        test_cases = [
-            "# @trace SPEC-01.01",
-            "// @trace SPEC-01.01",
-            "/* @trace SPEC-01.01 */",
-            "   @trace SPEC-01.01  # validation",
-        ]
-        for case in test_cases:
-            match = TRACE_PATTERN.search(case)
-            assert match is not None, f"Failed to match: {case}"
+        assert match.group(3) == sub_item
 
     @given(
         st.integers(min_value=1, max_value=99),
@@ -200,6 +181,27 @@ class TestParseAllSpecs:
         spec_ids = [s.spec_id for s in specs]
         assert spec_ids == sorted(spec_ids)
 
+    def test_reparses_edited_spec_file(self, project_with_specs: Path):
+        """Should pick up specs added to a file since the last call."""
+        spec_dir = project_with_specs / "docs" / "spec"
+        spec_file = spec_dir / "01-authentication.md"
+        assert "SPEC-01.04" not in {s.spec_id for s in parse_all_specs(spec_dir)}
+
+        with spec_file.open("a") as f:
+            f.write("\n[SPEC-01.04] Account locks after five failed logins\n")
+
+        assert "SPEC-01.04" in {s.spec_id for s in parse_all_specs(spec_dir)}
+
+    def test_cached_specs_are_immutable(self, project_with_specs: Path):
+        """Specs shared through the parse cache should reject mutation."""
+        spec_dir = project_with_specs / "docs" / "spec"
+        spec = parse_all_specs(spec_dir)[0]
+
+        with pytest.raises(FrozenInstanceError):
+            spec.issue_link = "chainlink:99"  # type: ignore[misc]
+
+        assert parse_all_specs(spec_dir)[0].issue_link == spec.issue_link
+
     def test_returns_empty_for_nonexistent_directory(self, temp_project_dir: Path):
         """Should return empty list for nonexistent directory."""
         fake_dir = temp_project_dir / "nonexistent"
@@ -234,12 +236,31 @@ class TestFindTraceMarkers:
         src_dir = project_with_code / "src"
         markers = find_trace_markers([src_dir])
 
-        # Verify line numbers point to actual trace markers
+        # Verify line numbers point to actual trace markers; split each file once
+        lines_by_file: dict[Path, list[str]] = {}
         for marker in markers:
-            content = marker.file_path.read_text()
-            lines = content.split("\n")
-            line = lines[marker.line_number - 1]
-            assert "@trace" in line
+            if marker.file_path not in lines_by_file:
+                lines_by_file[marker.file_path] = marker.file_path.read_text().split("\n")
+            assert "@trace" in lines_by_file[marker.file_path][marker.line_number - 1]
+
+    def test_rel_path_relative_to_root(self, project_with_code: Path):
+        """Should record each marker's path relative to the given root."""
+        src_dir = project_with_code / "src"
+        markers = find_trace_markers([src_dir], root=project_with_code)
+
+        assert markers
+        assert all(m.rel_path == "src/auth.py" for m in markers)
+
+    def test_skips_vendored_directories(self, project_with_code: Path):
+        """Should not descend into node_modules, .git, venv, etc."""
+        src_dir = project_with_code / "src"
+        vendored = src_dir / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "index.js").write_text("// @trace SPEC-09.09\n")
+
+        markers = find_trace_markers([src_dir])
+
+        assert "SPEC-09.09" not in [m.spec_id for m in markers]
 
     def test_searches_multiple_directories(self, project_with_code: Path):
         """Should search multiple directories."""
@@ -255,6 +276,114 @@ class TestFindTraceMarkers:
         assert len(src_markers) > 0
         assert len(test_markers) > 0
 
+    def test_line_numbers_and_context_from_raw_bytes(self, tmp_path: Path):
+        """Should number lines exactly, tolerate non-UTF-8 bytes, and not join lines."""
+        (tmp_path / "legacy.py").write_bytes(
+            b"\n".join(
+                [
+                    b"# caf\xe9",
+                    b"x = 1  # @trace SPEC-02.01",
+                    b"# @trace",
+                    b"# SPEC-02.02",
+                    b"",
+                    b"# @trace SPEC-02.03.b then @trace SPEC-02.04",
+                ]
+            )
+        )
+
+        markers = find_trace_markers([tmp_path])
+
+        assert [(m.spec_id, m.line_number) for m in markers] == [
+            ("SPEC-02.01", 2),
+            ("SPEC-02.03.b", 6),
+            ("SPEC-02.04", 6),
+        ]
+        assert markers[0].context == "x = 1  # @trace SPEC-02.01"
+
+    def test_finds_markers_across_many_files(self, tmp_path: Path):
+        """Should find every marker when the scan is spread over threads."""
+        for i in range(40):
+            (tmp_path / f"mod_{i:02d}.py").write_bytes(
+                b"".join([b"# @trace SPEC-%02d.01\n" % i, b"def f():\n    pass\n"])
+            )
+
+        markers = find_trace_markers([tmp_path])
+
+        assert {m.spec_id for m in markers} == {f"SPEC-{i:02d}.01" for i in range(40)}
+        assert all(m.line_number == 1 for m in markers)
+
+
+class TestLinkSpecToIssue:
+    """Tests for link_spec_to_issue and unlink_spec functions."""
+
+    def test_links_unlinked_spec(self, project_with_specs: Path):
+        """Should append an issue link to the spec's line only."""
+        spec_file = project_with_specs / "docs" / "spec" / "01-authentication.md"
+        before = spec_file.read_text().split("\n")
+
+        assert link_spec_to_issue("SPEC-01.03", "7", "chainlink", project_with_specs)
+
+        after = spec_file.read_text().split("\n")
+        assert len(after) == len(before)
+        changed = [i for i, (a, b) in enumerate(zip(before, after, strict=True)) if a != b]
+        assert len(changed) == 1
+        assert after[changed[0]].endswith("<!-- chainlink:7 -->")
+
+    def test_replaces_existing_link(self, project_with_specs: Path):
+        """Should replace rather than duplicate an existing link."""
+        assert link_spec_to_issue("SPEC-01", "bd-a1", "beads", project_with_specs)
+
+        spec_dir = project_with_specs / "docs" / "spec"
+        spec = next(s for s in parse_all_specs(spec_dir) if s.spec_id == "SPEC-01")
+        assert spec.issue_link == "beads:bd-a1"
+        assert "chainlink:1" not in spec_dir.joinpath("01-authentication.md").read_text()
+
+    def test_unlinks_spec(self, project_with_specs: Path):
+        """Should remove the issue link from the spec's line."""
+        assert unlink_spec("SPEC-01.02", project_with_specs)
+
+        spec_dir = project_with_specs / "docs" / "spec"
+        spec = next(s for s in parse_all_specs(spec_dir) if s.spec_id == "SPEC-01.02")
+        assert spec.issue_link is None
+
+    def test_returns_false_for_unknown_spec(self, project_with_specs: Path):
+        """Should return False when the spec does not exist."""
+        assert not link_spec_to_issue("SPEC-99.99", "1", "chainlink", project_with_specs)
+        assert not unlink_spec("SPEC-01.03", project_with_specs)
+
+
+class TestGetIssueStatus:
+    """Tests for get_issue_status function."""
+
+    @pytest.mark.parametrize(
+        "link,stdout,expected",
+        [
+            ("chainlink:1", b"#1 Login\nStatus: Closed\n", "closed"),
+            ("chainlink:1", b"#1 Login\nStatus: In Progress\n", "in_progress"),
+            ("chainlink:1", b"#1 Login\nStatus: open\n", "open"),
+            ("beads:bd-a1", b"bd-a1: Login\nstatus: in_progress\n", "in_progress"),
+            ("beads:bd-a1", b"bd-a1: Reopen in_progress work\nstatus: closed\n", "closed"),
+        ],
+    )
+    def test_parses_status_from_output(
+        self, tmp_path: Path, link: str, stdout: bytes, expected: str
+    ):
+        """Should map CLI output to a normalized status, preferring closed."""
+        with patch("traceability.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout=stdout)
+            assert get_issue_status(link, tmp_path) == expected
+
+    def test_returns_none_on_cli_failure(self, tmp_path: Path):
+        """Should return None when the CLI exits non-zero."""
+        with patch("traceability.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout=b"")
+            assert get_issue_status("chainlink:1", tmp_path) is None
+
+    def test_returns_none_for_unknown_provider(self, tmp_path: Path):
+        """Should return None for malformed or unknown links."""
+        assert get_issue_status("jira:ABC-1", tmp_path) is None
+        assert get_issue_status("nolink", tmp_path) is None
+
 
 class TestGenerateCoverageReport:
     """Tests for generate_coverage_report function."""
@@ -265,12 +394,25 @@ class TestGenerateCoverageReport:
 
         assert len(coverage) >= 3
 
-        # Find coverage for SPEC-01.01
-        cov_01_01 = next(
-            (c for c in coverage if c.spec.spec_id == "SPEC-01.01"), None
+        by_spec_id = {c.spec.spec_id: c for c in coverage}
+        assert "SPEC-01.01" in by_spec_id
+        assert by_spec_id["SPEC-01.01"].trace_count > 0  # Has traces in code and tests
+
+    def test_section_collects_paragraph_traces_in_scan_order(
+        self, project_with_code: Path
+    ):
+        """A section spec should list every trace under it, in scan order."""
+        coverage = generate_coverage_report(project_with_code)
+        code_markers = find_trace_markers(
+            [project_with_code / "src"], root=project_with_code
         )
-        assert cov_01_01 is not None
-        assert cov_01_01.trace_count > 0  # Has traces in code and tests
+
+        by_spec_id = {c.spec.spec_id: c for c in coverage}
+        assert by_spec_id["SPEC-01"].code_locations == [
+            f"{m.rel_path}:{m.line_number}"
+            for m in code_markers
+            if m.spec_id.startswith("SPEC-01")
+        ]
 
     def test_coverage_includes_test_locations(self, project_with_code: Path):
         """Should include test file locations in coverage."""
@@ -280,6 +422,16 @@ class TestGenerateCoverageReport:
         has_tests = any(c.test_count > 0 for c in coverage)
         assert has_tests
 
+    def test_looks_up_each_issue_status_once(self, project_with_code: Path):
+        """Should fetch the status of every linked issue exactly once."""
+        with patch("traceability.get_issue_status", return_value="closed") as mock_status:
+            coverage = generate_coverage_report(project_with_code)
+
+        linked = [c for c in coverage if c.spec.issue_link]
+        assert mock_status.call_count == len(linked) == 3
+        assert all(c.issue_status == "closed" for c in linked)
+        assert all(c.issue_status is None for c in coverage if not c.spec.issue_link)
+
 
 class TestFormatCoverageReport:
     """Tests for format_coverage_report function."""
@@ -317,28 +469,28 @@ class TestPropertyBasedTraceability:
     )
     @settings(max_examples=20)
     def test_spec_parsing_preserves_all_specs(
-        self, spec_ids: list[tuple[int, int]]
+        self, shared_tmp_dir: Path, spec_ids: list[tuple[int, int]]
     ):
         """All specs in a file should be found by parsing."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Generate spec content
-            lines = ["# Test Spec\n"]
-            for section, paragraph in spec_ids:
-                lines.append(f"[SPEC-{section:02d}.{paragraph:02d}] Test requirement\n")
+        # Generate spec content; each example overwrites the same file
+        lines = [
+            "# Test Spec\n",
+            *(
+                f"[SPEC-{section:02d}.{paragraph:02d}] Test requirement\n"
+                for section, paragraph in spec_ids
+            ),
+        ]
 
-            spec_file = Path(tmpdir) / "test_spec.md"
-            spec_file.write_text("\n".join(lines))
+        spec_file = shared_tmp_dir / "test_spec.md"
+        spec_file.write_bytes("\n".join(lines).encode())
 
-            parsed = parse_specs_from_file(spec_file)
+        parsed = parse_specs_from_file(spec_file)
 
-            # All input specs should be found
-            for section, paragraph in spec_ids:
-                expected_id = f"SPEC-{section:02d}.{paragraph:02d}"
-                assert any(
-                    s.spec_id == expected_id for s in parsed
-                ), f"Missing {expected_id}"
+        # All input specs should be found
+        parsed_ids = {s.spec_id for s in parsed}
+        for section, paragraph in spec_ids:
+            expected_id = f"SPEC-{section:02d}.{paragraph:02d}"
+            assert expected_id in parsed_ids, f"Missing {expected_id}"
 
     @given(
         st.lists(
@@ -352,29 +504,33 @@ class TestPropertyBasedTraceability:
     )
     @settings(max_examples=10)
     def test_trace_finding_finds_all_markers(
-        self, trace_ids: list[tuple[int, int]]
+        self, shared_tmp_dir: Path, trace_ids: list[tuple[int, int]]
     ):
         """All @trace markers in code should be found."""
-        import tempfile
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            src_dir = Path(tmpdir) / "src"
-            src_dir.mkdir(exist_ok=True)
-
-            # Generate code with traces
-            lines = ["# Test code\n"]
-            for section, paragraph in trace_ids:
-                lines.append(f"# @trace SPEC-{section:02d}.{paragraph:02d}\n")
-                lines.append(f"def func_{section}_{paragraph}(): pass\n")
+        src_dir = shared_tmp_dir / "src"
+        src_dir.mkdir(exist_ok=True)
+
+        # Generate code with traces; the scan covers the whole directory, so
+        # each example overwrites the one file rather than adding another
+        lines = [
+            "# Test code\n",
+            *(
+                line
+                for section, paragraph in trace_ids
+                for line in (
+                    f"# @trace SPEC-{section:02d}.{paragraph:02d}\n",
+                    f"def func_{section}_{paragraph}(): pass\n",
+                )
+            ),
+        ]
 
-            code_file = src_dir / "test_code.py"
-            code_file.write_text("\n".join(lines))
+        code_file = src_dir / "test_code.py"
+        code_file.write_bytes("\n".join(lines).encode())
 
-            markers = find_trace_markers([src_dir])
+        markers = find_trace_markers([src_dir])
 
-            # All traces should be found
-            for section, paragraph in trace_ids:
-                expected_id = f"SPEC-{section:02d}.{paragraph:02d}"
-                assert any(
-                    m.spec_id == expected_id for m in markers
-                ), f"Missing trace {expected_id}"
+        # All traces should be found
+        marker_ids = {m.spec_id for m in markers}
+        for section, paragraph in trace_ids:
+            expected_id = f"SPEC-{section:02d}.{paragraph:02d}"
+            assert expected_id in marker_ids, f"Missing trace {expected_id}"